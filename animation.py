@@ -1,20 +1,100 @@
 import pygame
+import atlas
 from assets import load_image
+from bake import load_baked, release_baked
+
+# (sheet path, frames, scale) -> (right frames, left frames)
+_frame_cache: dict[tuple[str, int, int], tuple[tuple[pygame.Surface, ...], tuple[pygame.Surface, ...]]] = {}
+
 
 class SpriteSheet:
     def __init__(self, path: str):
         self.sheet = load_image(path, alpha=True)
 
+    def frame(self, row: int, col: int, frame_w: int, frame_h: int, scale: int = 1):
+        rect = pygame.Rect(col * frame_w, row * frame_h, frame_w, frame_h)
+        frame = self.sheet.subsurface(rect)
+        if scale != 1:
+            frame = pygame.transform.scale(frame, (frame_w * scale, frame_h * scale))
+        return frame
+
     def slice_row(self, row: int, frames: int, frame_w: int, frame_h: int, scale: int = 1):
-        out = []
-        y = row * frame_h
-        for i in range(frames):
-            rect = pygame.Rect(i * frame_w, y, frame_w, frame_h)
-            frame = self.sheet.subsurface(rect)
-            if scale != 1:
-                frame = pygame.transform.scale(frame, (frame_w * scale, frame_h * scale))
-            out.append(frame)
-        return out
+        return [self.frame(row, i, frame_w, frame_h, scale) for i in range(frames)]
+
+
+def load_frame_sequence(path: str, frames: int, scale: int = 1):
+    """
+    Geeft (right, left) frame-tuples voor een horizontale sheet.
+    Slicen/schalen/flippen gebeurt maar 1x per (path, frames, scale);
+    daarna delen alle enemies/players/projectiles dezelfde (immutable) tuples.
+    De frames zijn bijgesneden atlas frames (atlas.py): volle grootte via
+    atlas.frame_size, tekenen via de RenderQueue (die past de trim offset toe).
+    """
+    key = (path, int(frames), int(scale))
+    cached = _frame_cache.get(key)
+    if cached is not None:
+        return cached
+
+    for _ in iter_frame_sequence(path, frames, scale):
+        pass
+    return _frame_cache[key]
+
+
+def iter_frame_sequence(path: str, frames: int, scale: int = 1):
+    """
+    Zelfde als load_frame_sequence, maar als generator: yield na het laden van
+    de sheet en na elk frame, zodat het over meerdere game frames verdeeld kan
+    worden (zie prefetch.py). Vult aan het eind de shared cache.
+    """
+    key = (path, int(frames), int(scale))
+    if key in _frame_cache:
+        return
+
+    right = []
+    left = []
+
+    # offline gebakken (bake.py): al gesliced/geschaald/geflipt, alleen nog de atlas in
+    baked = load_baked(path, frames, scale)
+    if baked is not None:
+        for r, l in zip(*baked):
+            right.append(atlas.sprites.add(r))
+            left.append(atlas.sprites.add(l))
+            yield
+        del baked, r, l  # frombuffer surfaces los: mmap kan dicht
+        release_baked(path, frames, scale)
+        _frame_cache[key] = (tuple(right), tuple(left))
+        return
+
+    sheet = SpriteSheet(path)
+    fw = sheet.sheet.get_width() // frames
+    fh = sheet.sheet.get_height()
+    yield
+
+    for i in range(frames):
+        f = sheet.frame(0, i, fw, fh, scale)
+        right.append(atlas.sprites.add(f))
+        left.append(atlas.sprites.add(pygame.transform.flip(f, True, False)))
+        yield
+
+    _frame_cache[key] = (tuple(right), tuple(left))
+
+
+def has_frame_sequence(path: str, frames: int, scale: int = 1) -> bool:
+    return (path, int(frames), int(scale)) in _frame_cache
+
+
+def build_animations(anims_cfg: dict, scale: int) -> dict:
+    """config["anims"] -> animations dict voor Animator (frames uit de shared cache)."""
+    animations = {}
+    for name, a in anims_cfg.items():
+        right, left = load_frame_sequence(a["sheet"], a["frames"], scale)
+        animations[name] = {
+            "right": right,
+            "left": left,
+            "loop": a.get("loop", True),
+        }
+    return animations
+
 
 class Animator:
     def __init__(self, animations: dict, default: str, fps: int):
@@ -1,13 +1,69 @@
 import pygame
 
+# optionele asset bundle (bundle.py, main.py --bundle): paths die erin zitten
+# worden daaruit gelezen i.p.v. als losse file
+_bundle = None
+
 _image_cache: dict[tuple[str, bool, int], pygame.Surface] = {}
+_scene_cache: dict[tuple[str, tuple[int, int]], pygame.Surface] = {}
+
+# al gedecodeerd op een worker thread (loader.py / prefetch.py), nog niet geconverteerd
+_decoded: dict[str, pygame.Surface] = {}
+
+_sound_cache: dict[str, pygame.mixer.Sound] = {}
+
+
+def use_bundle(bundle_path: str | None):
+    """Alle load_* gaan via de bundle (None = weer losse files)."""
+    global _bundle
+    if bundle_path is None:
+        _bundle = None
+        return
+    from bundle import AssetBundle
+    _bundle = AssetBundle(bundle_path)
+
+
+def active_bundle():
+    return _bundle
+
+
+def _source(path: str):
+    """(file object of path, namehint) voor de pygame loaders."""
+    if _bundle is not None and path in _bundle:
+        return _bundle.open(path), path
+    return path, ""
+
+
+def decode_image(path: str) -> pygame.Surface:
+    """Alleen decoderen (geen convert, geen cache): mag buiten de main thread."""
+    src, hint = _source(path)
+    return pygame.image.load(src, hint)
+
+
+def decode_sound(path: str) -> pygame.mixer.Sound:
+    src, _ = _source(path)
+    return pygame.mixer.Sound(src)
+
+
+def add_decoded(path: str, img: pygame.Surface):
+    _decoded[path] = img
+
+
+def has_decoded(path: str) -> bool:
+    return path in _decoded
+
+
+def _load(path: str) -> pygame.Surface:
+    img = _decoded.pop(path, None)
+    return img if img is not None else decode_image(path)
+
 
 def load_image(path: str, alpha: bool = True, scale: int = 1) -> pygame.Surface:
     key = (path, alpha, scale)
     if key in _image_cache:
         return _image_cache[key]
 
-    img = pygame.image.load(path)
+    img = _load(path)
     img = img.convert_alpha() if alpha else img.convert()
 
     if scale != 1:
@@ -15,4 +71,50 @@ def load_image(path: str, alpha: bool = True, scale: int = 1) -> pygame.Surface:
         img = pygame.transform.scale(img, (w * scale, h * scale))
 
     _image_cache[key] = img
-    return img
\ No newline at end of file
+    return img
+
+
+def has_image(path: str, alpha: bool = True, scale: int = 1) -> bool:
+    return (path, alpha, scale) in _image_cache
+
+
+def load_scene(path: str, size) -> pygame.Surface:
+    """Achtergrond (opaque) geschaald naar size, gecached."""
+    key = (path, tuple(size))
+    img = _scene_cache.get(key)
+    if img is None:
+        img = _load(path).convert()
+        if img.get_size() != key[1]:
+            img = pygame.transform.scale(img, key[1])
+        _scene_cache[key] = img
+    return img
+
+
+def has_scene(path: str, size) -> bool:
+    return (path, tuple(size)) in _scene_cache
+
+
+# -------------------------
+# SOUNDS
+# -------------------------
+def add_sound(path: str, sound: pygame.mixer.Sound):
+    _sound_cache[path] = sound
+
+
+def load_sound(path: str, volume: float | None = None) -> pygame.mixer.Sound:
+    """Gedeelde Sound per path (lazy: pas bij het eerste gebruik decoderen)."""
+    snd = _sound_cache.get(path)
+    if snd is None:
+        snd = _sound_cache[path] = decode_sound(path)
+    if volume is not None:
+        snd.set_volume(volume)
+    return snd
+
+
+def load_music(path: str):
+    """pygame.mixer.music.load (streamt; uit de bundle via een file object)."""
+    src, hint = _source(path)
+    if hint:
+        pygame.mixer.music.load(src, hint)
+    else:
+        pygame.mixer.music.load(src)
@@ -0,0 +1,160 @@
+# atlas.py
+"""
+Texture atlas: animatie frames (en UI stukken) in een paar grote pages.
+
+Frames worden bijgesneden tot hun zichtbare pixels (get_bounding_rect: ~80%
+van een enemy frame is transparant) en met een shelf packer in pages van
+PAGE_SIZE gezet. Een frame is daarna een subsurface van zijn page; de
+registry onthoudt per frame (page, area, trim offset, volle grootte).
+
+    frames = pack_frames(frames)        # animation.load_frame_sequence doet dit
+    rect = pygame.Rect((0, 0), frame_size(img))   # rect zoals het onbesneden frame
+
+RenderQueue (render.py) blit een atlas frame als (page, dest + offset, area):
+draw() code blijft screen.blit(img, rect) doen. Frames buiten de RenderQueue
+om tekenen (direct op een Surface) mist de trim offset.
+"""
+import pygame
+
+PAGE_SIZE = 2048
+PADDING = 1
+
+
+class ShelfPacker:
+    """Rechthoeken in rijen (shelves) plaatsen; eerste shelf met de minste verspilling."""
+
+    def __init__(self, width: int, height: int, padding: int = PADDING):
+        self.width = int(width)
+        self.height = int(height)
+        self.padding = int(padding)
+        self._shelves: list[list[int]] = []  # [y, hoogte, x cursor]
+        self._next_y = 0
+
+    def insert(self, w: int, h: int):
+        """(x, y) voor een w x h rect, of None als de page vol is."""
+        p = self.padding
+        w += p
+        h += p
+
+        best = None
+        for shelf in self._shelves:
+            y, sh, x = shelf
+            if h <= sh and x + w <= self.width and (best is None or sh < best[1]):
+                best = shelf
+        if best is not None:
+            x = best[2]
+            best[2] += w
+            return x, best[0]
+
+        if self._next_y + h > self.height or w > self.width:
+            return None
+        shelf = [self._next_y, h, w]
+        self._shelves.append(shelf)
+        self._next_y += h
+        return 0, shelf[0]
+
+
+class TextureAtlas:
+    def __init__(self, page_size: int = PAGE_SIZE, padding: int = PADDING):
+        self.page_size = int(page_size)
+        self.padding = int(padding)
+        self.pages: list[pygame.Surface] = []
+        self._packers: list[ShelfPacker] = []
+        self._owned: list[pygame.Surface] = []  # frames uit deze atlas (voor clear)
+        self.packed = 0
+        self.pixels = 0  # gebruikte page pixels (stats)
+
+    def _new_page(self) -> int:
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self._packers.append(ShelfPacker(self.page_size, self.page_size, self.padding))
+        return len(self.pages) - 1
+
+    def add(self, surf: pygame.Surface, trim: bool = True, like=None) -> pygame.Surface:
+        """
+        Kopieer surf (bijgesneden als trim) in een page en geef de subsurface
+        terug. like: atlas frame waar surf een variant van is (stun tint):
+        zelfde trim offset en volle grootte. Te grote surfaces blijven zoals ze zijn.
+        """
+        ref = surf if like is None else like
+        full = frame_size(ref)
+        base_x, base_y = frame_offset(ref)
+        bounds = surf.get_bounding_rect() if trim else surf.get_rect()
+        if bounds.w == 0 or bounds.h == 0:
+            bounds = pygame.Rect(0, 0, 1, 1)  # volledig transparant frame
+        if bounds.w > self.page_size or bounds.h > self.page_size:
+            return surf
+
+        for i, packer in enumerate(self._packers):
+            pos = packer.insert(bounds.w, bounds.h)
+            if pos is not None:
+                break
+        else:
+            i = self._new_page()
+            pos = self._packers[i].insert(bounds.w, bounds.h)
+
+        page = self.pages[i]
+        area = pygame.Rect(pos, bounds.size)
+        # ADD op een lege (0,0,0,0) area = exacte kopie van de pixels (ook alpha);
+        # leegmaken omdat een page na clear() hergebruikt wordt
+        page.fill((0, 0, 0, 0), area)
+        page.blit(surf, area, bounds, special_flags=pygame.BLEND_RGBA_ADD)
+
+        frame = page.subsurface(area)
+        _frames[frame] = (
+            page, area,
+            base_x + bounds.x, base_y + bounds.y,
+            full,
+        )
+        self._owned.append(frame)
+        self.packed += 1
+        self.pixels += area.w * area.h
+        return frame
+
+    def clear(self):
+        """
+        Alle frames vergeten (ook uit de registry). De pages blijven en worden
+        opnieuw gevuld: frames van voor clear() zijn daarna ongeldig.
+        """
+        for frame in self._owned:
+            _frames.pop(frame, None)
+        self._owned.clear()
+        self._packers = [ShelfPacker(self.page_size, self.page_size, self.padding) for _ in self.pages]
+        self.packed = 0
+        self.pixels = 0
+
+
+# frame subsurface -> (page, area, trim x, trim y, volle (w, h))
+_frames: dict[pygame.Surface, tuple] = {}
+
+sprites = TextureAtlas()
+ui = TextureAtlas(page_size=1024)
+
+
+def pack_frames(frames) -> tuple:
+    """Frames (bijgesneden) in de sprite atlas."""
+    return tuple(sprites.add(f) for f in frames)
+
+
+def pack_ui(surf: pygame.Surface) -> pygame.Surface:
+    """UI stuk (niet bijgesneden: UI code rekent met de volle grootte) in de UI atlas."""
+    return ui.add(surf, trim=False)
+
+
+def region(surf: pygame.Surface):
+    """(page, area, trim x, trim y, volle grootte) of None als surf geen atlas frame is."""
+    return _frames.get(surf)
+
+
+def frame_offset(surf: pygame.Surface) -> tuple[int, int]:
+    info = _frames.get(surf)
+    return (info[2], info[3]) if info is not None else (0, 0)
+
+
+def frame_size(surf: pygame.Surface) -> tuple[int, int]:
+    """Grootte van het frame zoals voor het bijsnijden."""
+    info = _frames.get(surf)
+    return info[4] if info is not None else surf.get_size()
@@ -0,0 +1,257 @@
+# bake.py
+"""
+Offline sprite bake: alle frame sequences uit config (PLAYER, enemies,
+PROJECTILES) gesliced, geschaald en geflipt naar raw RGBA in .bake/.
+
+Runtime (animation.iter_frame_sequence) mmapt een gebakken sequence en maakt
+de frames met pygame.image.frombuffer i.p.v. sheet slicen + transform.scale +
+flip. Pixels staan in PIXEL_FORMAT (BGRA = het convert_alpha formaat van SDL op
+little endian): zonder kopie of convert direct blitbaar. Past dat niet bij het
+display, dan alsnog 1 convert_alpha per frame. Daarna kopieert animation.py de
+zichtbare pixels naar de sprite atlas (atlas.py) en gaat de mmap weer dicht.
+
+Cache key per sequence = sha1(source bytes) + frames + scale + BAKE_VERSION.
+Een gewijzigde sheet of andere frames/scale in config.py matcht dus niet meer
+en valt vanzelf terug op de normale (runtime) route tot de volgende bake.
+
+    python bake.py              # bakken wat verouderd is (+ oude entries opruimen)
+    python bake.py --force      # alles opnieuw
+
+.bake/manifest.json:
+    {"version", "entries": {key: {sheet, frames, scale, size, file, src_stat}}}
+    (src_stat = [size, mtime_ns]: ongewijzigde files hoeven runtime niet gehasht)
+"""
+import hashlib
+import json
+import mmap
+import os
+
+import pygame
+
+import assets
+
+BAKE_VERSION = 1
+BAKE_DIR = ".bake"
+MANIFEST = "manifest.json"
+PIXEL_FORMAT = "BGRA"
+
+_manifest: dict | None = None               # lazy geladen
+_by_spec: dict[tuple, dict] = {}            # (sheet, frames, scale) -> entry
+_valid: dict[tuple, bool] = {}              # gevalideerde specs (1x per run)
+_maps: dict[tuple, mmap.mmap] = {}          # spec -> mmap (frombuffer surfaces wijzen hierin)
+_native: bool | None = None                 # PIXEL_FORMAT == display alpha formaat?
+
+
+# ----------------------------------
+# KEYS
+# ----------------------------------
+def _file_hash(path: str) -> str:
+    bundle = assets.active_bundle()
+    if bundle is not None and path in bundle:
+        return hashlib.sha1(bundle.view(path)).hexdigest()
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _stat(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def entry_key(src_hash: str, frames: int, scale: int) -> str:
+    raw = f"{src_hash}:{int(frames)}:{int(scale)}:{BAKE_VERSION}"
+    return hashlib.sha1(raw.encode("ascii")).hexdigest()[:20]
+
+
+# ----------------------------------
+# RUNTIME
+# ----------------------------------
+def _load_manifest(bake_dir: str = BAKE_DIR) -> dict:
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(os.path.join(bake_dir, MANIFEST), "r", encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+        if _manifest.get("version") != BAKE_VERSION:
+            _manifest = {}
+        for key, e in _manifest.get("entries", {}).items():
+            _by_spec[(e["sheet"], e["frames"], e["scale"])] = dict(e, key=key)
+    return _manifest
+
+
+def is_baked(path: str, frames: int, scale: int) -> bool:
+    """Staat er een geldige (niet verouderde) bake voor deze sequence?"""
+    spec = (path, int(frames), int(scale))
+    ok = _valid.get(spec)
+    if ok is None:
+        _load_manifest()
+        e = _by_spec.get(spec)
+        if e is None:
+            ok = False
+        elif e.get("src_stat") is not None and _stat(path) == e["src_stat"]:
+            ok = True  # zelfde size + mtime: hashen overslaan
+        else:
+            try:
+                ok = entry_key(_file_hash(path), frames, scale) == e["key"]
+            except OSError:
+                ok = False
+        _valid[spec] = ok
+    return ok
+
+
+def load_baked(path: str, frames: int, scale: int):
+    """(right, left) frame-tuples uit de bake cache, of None."""
+    if not is_baked(path, frames, scale):
+        return None
+
+    e = _by_spec[(path, int(frames), int(scale))]
+    w, h = e["size"]
+    n = w * h * 4
+    frames = int(frames)
+    try:
+        with open(os.path.join(BAKE_DIR, e["file"]), "rb") as f:
+            if os.fstat(f.fileno()).st_size != n * 2 * frames:
+                return None
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        return None
+    _maps[(path, frames, int(scale))] = mm
+
+    convert = not _is_native()
+    view = memoryview(mm)
+    out = []
+    for i in range(2 * frames):
+        surf = pygame.image.frombuffer(view[i * n:(i + 1) * n], (w, h), PIXEL_FORMAT)
+        out.append(surf.convert_alpha() if convert else surf)
+    return tuple(out[:frames]), tuple(out[frames:])
+
+
+def release_baked(path: str, frames: int, scale: int):
+    """
+    mmap van een sequence sluiten als de frames gekopieerd zijn (atlas.py):
+    anders blijven alle aangeraakte pages van de bake in het geheugen.
+    Wijzen er nog surfaces in, dan blijft hij gewoon open.
+    """
+    mm = _maps.pop((path, int(frames), int(scale)), None)
+    if mm is None:
+        return
+    try:
+        mm.close()
+    except BufferError:
+        _maps[(path, int(frames), int(scale))] = mm
+
+
+def _is_native() -> bool:
+    """Heeft een frombuffer(PIXEL_FORMAT) surface al het convert_alpha formaat?"""
+    global _native
+    if _native is None:
+        if pygame.display.get_surface() is None:
+            return True  # geen display: convert_alpha kan niet, buffer-surface zelf gebruiken
+        probe = pygame.image.frombuffer(bytes(4), (1, 1), PIXEL_FORMAT)
+        _native = probe.get_masks() == probe.convert_alpha().get_masks()
+    return _native
+
+
+# ----------------------------------
+# BAKE (offline)
+# ----------------------------------
+def config_specs(cfg_module) -> list[tuple[str, int, int]]:
+    """Alle (sheet, frames, scale) die de game uit config laadt."""
+    specs = set()
+    for value in vars(cfg_module).values():
+        if isinstance(value, dict) and isinstance(value.get("anims"), dict):
+            scale = int(value.get("scale", 2))  # zelfde default als Player/EnemyBase
+            for a in value["anims"].values():
+                specs.add((a["sheet"], int(a["frames"]), scale))
+    for pcfg in getattr(cfg_module, "PROJECTILES", {}).values():
+        specs.add((pcfg["sheet"], int(pcfg["frames"]), int(pcfg.get("scale", 2))))
+    return sorted(specs)
+
+
+def baked_sheets(cfg_module) -> set[str]:
+    """Sheets waarvan elke sequence uit config gebakken is (hoeven niet gedecodeerd)."""
+    by_sheet: dict[str, bool] = {}
+    for path, frames, scale in config_specs(cfg_module):
+        by_sheet[path] = by_sheet.get(path, True) and is_baked(path, frames, scale)
+    return {p for p, ok in by_sheet.items() if ok}
+
+
+def _bake_one(path: str, frames: int, scale: int):
+    from animation import SpriteSheet
+
+    sheet = SpriteSheet(path)
+    fw = sheet.sheet.get_width() // frames
+    fh = sheet.sheet.get_height()
+    right = [sheet.frame(0, i, fw, fh, scale) for i in range(frames)]
+    left = [pygame.transform.flip(f, True, False) for f in right]
+    size = right[0].get_size()
+    data = b"".join(pygame.image.tobytes(f, PIXEL_FORMAT) for f in right + left)
+    return size, data
+
+
+def bake(cfg_module, bake_dir: str = BAKE_DIR, force: bool = False, log=print) -> dict:
+    os.makedirs(bake_dir, exist_ok=True)
+    man_path = os.path.join(bake_dir, MANIFEST)
+    try:
+        with open(man_path, "r", encoding="utf-8") as f:
+            old = json.load(f)
+    except (OSError, ValueError):
+        old = {}
+    old_entries = old.get("entries", {}) if old.get("version") == BAKE_VERSION and not force else {}
+
+    entries = {}
+    baked = kept = 0
+    for path, frames, scale in config_specs(cfg_module):
+        key = entry_key(_file_hash(path), frames, scale)
+        fname = key + ".rgba"
+        if key in old_entries and os.path.exists(os.path.join(bake_dir, fname)):
+            entries[key] = dict(old_entries[key], src_stat=_stat(path))
+            kept += 1
+            continue
+
+        size, data = _bake_one(path, frames, scale)
+        with open(os.path.join(bake_dir, fname), "wb") as f:
+            f.write(data)
+        entries[key] = {
+            "sheet": path, "frames": frames, "scale": scale,
+            "size": list(size), "file": fname, "src_stat": _stat(path),
+        }
+        baked += 1
+        log(f"  baked {path} x{scale} ({frames} frames, {len(data) / (1024 * 1024):.1f} MB)")
+
+    # entries die niet meer in config staan / verouderd zijn opruimen
+    removed = 0
+    for name in os.listdir(bake_dir):
+        if name.endswith(".rgba") and name[:-5] not in entries:
+            os.remove(os.path.join(bake_dir, name))
+            removed += 1
+
+    manifest = {"version": BAKE_VERSION, "entries": entries}
+    with open(man_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+    log(f"bake: {baked} baked, {kept} up to date, {removed} removed -> {bake_dir}/")
+    return manifest
+
+
+def main():
+    import argparse
+
+    import headless  # SDL dummy drivers (geen venster nodig om te bakken)
+
+    parser = argparse.ArgumentParser(description="Bake geschaalde/geflipte sprite frames naar raw RGBA")
+    parser.add_argument("--force", action="store_true", help="alles opnieuw bakken")
+    args = parser.parse_args()
+
+    headless.init()
+    import config
+    bake(config, force=args.force)
+
+
+if __name__ == "__main__":
+    main()
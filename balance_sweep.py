@@ -0,0 +1,200 @@
+# balance_sweep.py
+"""
+Balance sweep: parameter-grids over config (WAVES, enemy configs, ...) headless
+doorrekenen op een multiprocessing pool en per grid-punt aggregeren naar CSV.
+
+    python balance_sweep.py \\
+        --grid "WAVES.*.max_enemies=2,3,4" \\
+        --grid "WAVES.*.interval=(1.0,1.6),(1.4,2.2)" \\
+        --grid "ZOMBIE.hp=4,5,6" \\
+        --seeds 20 --out sweep.csv
+
+Grid keys: CONFIG_NAAM.key.key... ("*" = alle keys van die dict, cijfers = int keys).
+Waarden worden als Python literal gelezen (ints, floats, tuples, ...).
+"""
+import headless  # zet SDL dummy drivers VOOR de game-modules geladen worden
+
+import argparse
+import ast
+import csv
+import itertools
+import multiprocessing
+import time
+from contextlib import contextmanager
+
+import config
+
+# ----------------------------------
+# GRID PARSING
+# ----------------------------------
+def parse_grid_arg(text: str):
+    """'ZOMBIE.hp=4,5,6' -> ('ZOMBIE.hp', [4, 5, 6])"""
+    if "=" not in text:
+        raise argparse.ArgumentTypeError(f"grid must look like KEY=V1,V2,...: {text!r}")
+    key, values = text.split("=", 1)
+    key = key.strip()
+    try:
+        parsed = ast.literal_eval(f"[{values}]")
+    except (ValueError, SyntaxError) as exc:
+        raise argparse.ArgumentTypeError(f"cannot parse values for {key}: {values!r}") from exc
+    if not parsed:
+        raise argparse.ArgumentTypeError(f"no values for {key}")
+    return key, parsed
+
+
+def _path_token(token: str):
+    return int(token) if token.isdigit() else token
+
+
+def _resolve_targets(key: str):
+    """'WAVES.*.max_enemies' -> [(dict, last_key), ...] in de config module."""
+    parts = key.split(".")
+    if len(parts) < 2:
+        raise ValueError(f"grid key needs at least CONFIG.key: {key!r}")
+
+    root = getattr(config, parts[0], None)
+    if not isinstance(root, dict):
+        raise ValueError(f"config.{parts[0]} is not a dict")
+
+    nodes = [root]
+    for token in parts[1:-1]:
+        nxt = []
+        for node in nodes:
+            if token == "*":
+                nxt.extend(v for v in node.values() if isinstance(v, dict))
+            else:
+                nxt.append(node[_path_token(token)])
+        nodes = nxt
+
+    last = _path_token(parts[-1])
+    return [(node, last) for node in nodes]
+
+
+_MISSING = object()
+
+
+@contextmanager
+def apply_overrides(overrides):
+    """Zet config-waarden tijdelijk (in-place) en zet ze daarna terug."""
+    saved = []
+    try:
+        for key, value in overrides:
+            for node, last in _resolve_targets(key):
+                saved.append((node, last, node.get(last, _MISSING)))
+                node[last] = value
+        yield
+    finally:
+        for node, last, old in reversed(saved):
+            if old is _MISSING:
+                node.pop(last, None)
+            else:
+                node[last] = old
+
+
+# ----------------------------------
+# WORKER
+# ----------------------------------
+def run_one(job) -> dict:
+    """1 geseede headless run met overrides; draait in een worker process."""
+    overrides, seed, max_waves, max_time, dt = job
+    headless.init()  # no-op na de eerste run in dit process
+
+    from game_session import GameSession
+
+    with apply_overrides(overrides):
+        session = GameSession(seed=seed)
+        res = headless.run(session, headless.AutoPilot(), dt=dt, max_time=max_time, max_waves=max_waves)
+
+    res["overrides"] = overrides
+    return res
+
+
+# ----------------------------------
+# AGGREGATE
+# ----------------------------------
+def _mean(values):
+    return sum(values) / len(values) if values else 0.0
+
+
+def aggregate(results: list, grid_keys: list) -> list[dict]:
+    groups: dict[tuple, list] = {}
+    for r in results:
+        groups.setdefault(tuple(r["overrides"]), []).append(r)
+
+    rows = []
+    for overrides, runs in groups.items():
+        row = {k: repr(v) for k, v in overrides}
+        wave_times = [t for r in runs for t in r["wave_times"]]
+        seeds = sorted(r["seed"] for r in runs)
+        row.update({
+            "runs": len(runs),
+            "seeds": f"{seeds[0]}-{seeds[-1]}",
+            "survival_rate": _mean([1.0 if r["survived"] else 0.0 for r in runs]),
+            "waves_cleared_mean": _mean([r["waves_cleared"] for r in runs]),
+            "wave_time_mean": _mean(wave_times),
+            "coins_earned_mean": _mean([r["coins_earned"] for r in runs]),
+            "damage_taken_mean": _mean([r["damage_taken"] for r in runs]),
+            "sim_time_mean": _mean([r["time"] for r in runs]),
+        })
+        rows.append(row)
+
+    rows.sort(key=lambda row: [row.get(k, "") for k in grid_keys])
+    return rows
+
+
+def write_csv(path: str, rows: list[dict], grid_keys: list):
+    stat_cols = [
+        "runs", "seeds", "survival_rate", "waves_cleared_mean", "wave_time_mean",
+        "coins_earned_mean", "damage_taken_mean", "sim_time_mean",
+    ]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(grid_keys) + stat_cols)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+# ----------------------------------
+# CLI
+# ----------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Headless balance sweep over config grids")
+    parser.add_argument("--grid", action="append", type=parse_grid_arg, default=[],
+                        help='KEY=V1,V2,... bv. "WAVES.*.max_enemies=2,3" of "ZOMBIE.hp=4,5" (herhaalbaar)')
+    parser.add_argument("--seeds", type=int, default=10, help="runs per grid-punt")
+    parser.add_argument("--seed-base", type=int, default=0)
+    parser.add_argument("--waves", type=int, default=None, help="stop na N gecleare waves (default: alle)")
+    parser.add_argument("--max-time", type=float, default=900.0, help="max gesimuleerde seconden per run")
+    parser.add_argument("--dt", type=float, default=headless.SIM_DT)
+    parser.add_argument("--workers", type=int, default=None, help="default: aantal CPU's")
+    parser.add_argument("--out", default="sweep.csv")
+    args = parser.parse_args()
+
+    grid_keys = [k for k, _ in args.grid]
+    for k in grid_keys:
+        _resolve_targets(k)  # fail fast op typo's
+
+    points = list(itertools.product(*[[(k, v) for v in values] for k, values in args.grid]))
+    jobs = [
+        (tuple(point), args.seed_base + s, args.waves, args.max_time, args.dt)
+        for point in points
+        for s in range(args.seeds)
+    ]
+
+    print(f"{len(points)} grid points x {args.seeds} seeds = {len(jobs)} runs")
+    t0 = time.perf_counter()
+
+    with multiprocessing.Pool(processes=args.workers, initializer=headless.init) as pool:
+        results = []
+        for i, res in enumerate(pool.imap_unordered(run_one, jobs, chunksize=1), 1):
+            results.append(res)
+            if i % max(1, len(jobs) // 20) == 0 or i == len(jobs):
+                print(f"  {i}/{len(jobs)} runs ({time.perf_counter() - t0:.1f}s)")
+
+    rows = aggregate(results, grid_keys)
+    write_csv(args.out, rows, grid_keys)
+    print(f"wrote {len(rows)} rows to {args.out} in {time.perf_counter() - t0:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# benchmarks/__main__.py
+"""
+Benchmark runner.
+
+    python -m benchmarks run --out bench.json            # alle cases
+    python -m benchmarks run -k pickup -k collision      # alleen cases die matchen
+    python -m benchmarks compare baseline.json bench.json
+    python -m benchmarks compare baseline.json           # vergelijk met een verse run
+
+compare geeft exit code 1 als een case meer dan --threshold trager is.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+import pygame
+
+from benchmarks import suite
+
+
+def _meta() -> dict:
+    return {
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+    }
+
+
+def cmd_run(args) -> int:
+    results = suite.run_all(args.k, repeat=args.repeat, min_time=args.min_time)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"meta": _meta(), "results": results}, f, indent=2)
+        print(f"wrote {len(results)} results to {args.out}")
+    return 0
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """[(naam, base_us, cur_us, ratio, status)] voor alle cases in beide runs."""
+    rows = []
+    for name, base in baseline.items():
+        cur = current.get(name)
+        if cur is None:
+            continue
+        ratio = cur["us"] / base["us"] if base["us"] > 0 else float("inf")
+        if ratio > 1.0 + threshold:
+            status = "REGRESSION"
+        elif ratio < 1.0 - threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((name, base["us"], cur["us"], ratio, status))
+    return rows
+
+
+def cmd_compare(args) -> int:
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+
+    if args.current:
+        with open(args.current) as f:
+            current = json.load(f)["results"]
+    else:
+        current = suite.run_all(list(baseline), repeat=args.repeat, min_time=args.min_time, log=lambda *_: None)
+
+    rows = compare(baseline, current, args.threshold)
+    print(f"{'case':<32} {'base us':>10} {'now us':>10} {'ratio':>7}")
+    for name, base_us, cur_us, ratio, status in rows:
+        flag = "" if status == "ok" else f"  {status}"
+        print(f"{name:<32} {base_us:>10.2f} {cur_us:>10.2f} {ratio:>6.2f}x{flag}")
+
+    regressions = [r for r in rows if r[4] == "REGRESSION"]
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Gameplay hot path benchmarks")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p_run = sub.add_parser("run", help="draai de benchmarks")
+    p_run.add_argument("--out", default=None, help="schrijf resultaten naar JSON")
+    p_run.add_argument("-k", action="append", default=[], help="alleen cases waarvan de naam dit bevat (herhaalbaar)")
+
+    p_cmp = sub.add_parser("compare", help="vergelijk met een baseline JSON")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("current", nargs="?", default=None, help="default: verse run van dezelfde cases")
+    p_cmp.add_argument("--threshold", type=float, default=0.10, help="relatieve vertraging die als regressie telt")
+
+    for p in (p_run, p_cmp):
+        p.add_argument("--repeat", type=int, default=5)
+        p.add_argument("--min-time", type=float, default=0.2, help="min seconden per repeat")
+
+    args = parser.parse_args()
+    return cmd_run(args) if args.cmd == "run" else cmd_compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# benchmarks/bench_collision.py
+"""
+Projectile x enemy collisions: oude nested loop vs CollisionWorld.
+
+    python -m benchmarks.bench_collision
+"""
+import random
+import timeit
+
+import pygame
+
+from collision import CollisionWorld
+
+WORLD_WIDTH = 6000
+GROUND_Y = 680
+
+
+class _Body:
+    def __init__(self, rect: pygame.Rect):
+        self.rect = rect
+
+
+def make_entities(n: int, seed: int = 1):
+    """n entities, half enemies (384px, zoals ZOMBIE scale 3) en half books (128px)."""
+    rng = random.Random(seed)
+    enemies = []
+    projectiles = []
+    for i in range(n):
+        x = rng.uniform(0, WORLD_WIDTH)
+        if i % 2 == 0:
+            r = pygame.Rect(0, 0, 384, 384)
+            r.midbottom = (x, GROUND_Y)
+            enemies.append(_Body(r))
+        else:
+            r = pygame.Rect(0, 0, 128, 128)
+            r.center = (x, GROUND_Y - 120 + rng.uniform(-60, 60))
+            projectiles.append(_Body(r))
+    return enemies, projectiles
+
+
+def nested_loop(projectiles, enemies):
+    out = []
+    for p in projectiles:
+        for e in enemies:
+            if p.rect.colliderect(e.rect):
+                out.append((p, e))
+    return out
+
+
+def collision_world(world, projectiles, enemies):
+    world.set_layer("projectiles", projectiles)
+    world.set_layer("enemies", enemies)
+    return world.collisions("projectiles", "enemies")
+
+
+def run(counts=(50, 200, 1000), number: int = 20) -> dict:
+    results = {}
+    world = CollisionWorld()
+
+    for n in counts:
+        enemies, projectiles = make_entities(n)
+
+        # zelfde paren (volgorde mag verschillen)
+        a = {(id(p), id(e)) for p, e in nested_loop(projectiles, enemies)}
+        b = {(id(p), id(e)) for p, e in collision_world(world, projectiles, enemies)}
+        assert a == b, f"CollisionWorld mismatch at n={n}"
+
+        t_nested = min(timeit.repeat(lambda: nested_loop(projectiles, enemies), number=number, repeat=3)) / number
+        t_world = min(timeit.repeat(lambda: collision_world(world, projectiles, enemies), number=number, repeat=3)) / number
+
+        results[n] = {"nested_ms": t_nested * 1000.0, "world_ms": t_world * 1000.0, "pairs": len(a)}
+    return results
+
+
+def main():
+    print(f"{'entities':>8} {'pairs':>7} {'nested ms':>10} {'world ms':>10} {'speedup':>8}")
+    for n, r in run().items():
+        speedup = r["nested_ms"] / r["world_ms"] if r["world_ms"] > 0 else float("inf")
+        print(f"{n:>8} {r['pairs']:>7} {r['nested_ms']:>10.3f} {r['world_ms']:>10.3f} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
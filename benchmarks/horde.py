@@ -0,0 +1,171 @@
+# benchmarks/horde.py
+"""
+Horde stress scenario: veel meer entities dan normaal spel (max_enemies=6)
+om de echte plafonds te vinden.
+
+Houdt per frame N enemies (uit config.ENEMY_POOL) in leven, M books in de
+lucht en K coins op de grond, en draait voor een vast aantal 60 fps frames
+de vaste 120 Hz GameSession.step stappen (zoals main.py, via
+timestep.FixedTimestep) + draw_entities. Rapporteert FPS, frame-time
+percentielen en piek geheugen.
+
+    python -m benchmarks.horde --enemies 500 --books 300 --coins 1000 --frames 600
+    python -m benchmarks.horde --tracemalloc      # + Python heap piek (trager!)
+"""
+import headless  # SDL dummy drivers VOOR de game-modules
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import pygame
+
+
+def _percentile(sorted_vals: list, q: float) -> float:
+    idx = min(len(sorted_vals) - 1, int(round(q * (len(sorted_vals) - 1))))
+    return sorted_vals[idx]
+
+
+def _max_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS: bytes, linux (en andere unixes): KiB
+    if sys.platform == "darwin":
+        return rss / (1024.0 * 1024.0)
+    return rss / 1024.0
+
+
+class Horde:
+    """Vult een GameSession bij tot de gevraagde aantallen entities."""
+
+    def __init__(self, session, enemies: int, books: int, coins: int):
+        from entities.enemies.registry import get_enemy_class
+
+        self.session = session
+        self.n_enemies = int(enemies)
+        self.n_books = int(books)
+        self.n_coins = int(coins)
+        self._get_enemy_class = get_enemy_class
+        self.rng = session.streams.get("horde")
+
+        # player mag niet dood gaan (anders stopt spawn/loot)
+        player = session.player
+        player.max_hp = player.hp = 10 ** 9
+
+    def top_up(self):
+        import config
+        from pickups import CoinPickup
+
+        s = self.session
+        rng = self.rng
+        w = s.world_width
+
+        while len(s.enemies) < self.n_enemies:
+            etype, cfg_key = s.spawner._pick_enemy_spec()
+            cls = self._get_enemy_class(etype)
+            s.enemies.append(cls(rng.uniform(80, w - 80), s.ground_y, getattr(config, cfg_key)))
+
+        while len(s.projectiles) < self.n_books:
+            x = rng.uniform(0, w)
+            y = s.ground_y - rng.uniform(80, 200)
+            s.projectiles.append(s.projectile_pool.acquire(x, y, rng.choice((-1, 1))))
+
+        while len(s.pickups) < self.n_coins:
+            c = CoinPickup(rng.uniform(0, w), rng.uniform(200, s.ground_y - 40), value=1, rng=rng)
+            s.pickups.append(c)
+
+
+def run(enemies=500, books=300, coins=1000, frames=600, dt=1.0 / 60.0, seed=0,
+        draw=True, batched=True, trace_malloc=False) -> dict:
+    headless.init((1280, 720))
+    from game_session import GameSession, InputState
+    from render import RenderQueue, ENTITY_LAYERS
+    from timestep import FixedTimestep
+
+    screen = pygame.display.get_surface()
+    queue = RenderQueue(screen, ENTITY_LAYERS) if batched else None
+    session = GameSession(seed=seed)
+    horde = Horde(session, enemies, books, coins)
+    inp = InputState()
+    timestep = FixedTimestep()  # dt = frame tijd; de simulatie stapt met SIM_DT zoals het spel
+
+    horde.top_up()  # sprites laden / caches vullen valt buiten de meting
+    if trace_malloc:
+        tracemalloc.start()
+
+    frame_ms = []
+    t_start = time.perf_counter()
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        horde.top_up()
+        for _ in range(timestep.advance(dt)):
+            session.step(timestep.dt, inp)
+        if draw:
+            screen.fill((20, 20, 20))
+            if queue is not None:
+                session.draw_entities(queue)
+                queue.flush()
+            else:
+                session.draw_entities(screen)
+        frame_ms.append((time.perf_counter() - t0) * 1000.0)
+    wall = time.perf_counter() - t_start
+
+    heap_peak = None
+    if trace_malloc:
+        _, heap_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    vals = sorted(frame_ms)
+    return {
+        "frames": frames,
+        "fps": frames / wall if wall > 0 else float("inf"),
+        "avg_ms": sum(vals) / len(vals),
+        "p50_ms": _percentile(vals, 0.50),
+        "p95_ms": _percentile(vals, 0.95),
+        "p99_ms": _percentile(vals, 0.99),
+        "max_ms": vals[-1],
+        "max_rss_mb": _max_rss_mb(),
+        "heap_peak_mb": heap_peak / (1024.0 * 1024.0) if heap_peak is not None else None,
+        "entities": {
+            "enemies": len(session.enemies),
+            "projectiles": len(session.projectiles),
+            "pickups": len(session.pickups),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Horde stress scenario")
+    parser.add_argument("--enemies", type=int, default=500)
+    parser.add_argument("--books", type=int, default=300)
+    parser.add_argument("--coins", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-draw", action="store_true", help="alleen simulatie, geen draw_entities")
+    parser.add_argument("--no-batch", action="store_true", help="draw_entities(screen) i.p.v. een eigen RenderQueue")
+    parser.add_argument("--tracemalloc", action="store_true", help="meet ook de Python heap piek (vertraagt)")
+    args = parser.parse_args()
+
+    res = run(args.enemies, args.books, args.coins, args.frames, seed=args.seed,
+              draw=not args.no_draw, batched=not args.no_batch, trace_malloc=args.tracemalloc)
+
+    ents = res["entities"]
+    print(f"horde: {ents['enemies']} enemies, {ents['projectiles']} books, {ents['pickups']} pickups, {res['frames']} frames")
+    print(f"  fps      {res['fps']:.1f}")
+    print(f"  frame ms avg {res['avg_ms']:.2f}  p50 {res['p50_ms']:.2f}  p95 {res['p95_ms']:.2f}  "
+          f"p99 {res['p99_ms']:.2f}  max {res['max_ms']:.2f}")
+    if res["max_rss_mb"] is not None:
+        print(f"  max rss  {res['max_rss_mb']:.1f} MB")
+    if res["heap_peak_mb"] is not None:
+        print(f"  heap peak {res['heap_peak_mb']:.1f} MB (tracemalloc)")
+
+
+if __name__ == "__main__":
+    main()
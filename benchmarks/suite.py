@@ -0,0 +1,294 @@
+# benchmarks/suite.py
+"""
+Microbenchmarks van de gameplay hot paths.
+
+Elke case is een setup-functie die een callable teruggeeft; de runner meet
+die callable (beste van N repeats, in microseconden per call).
+Toevoegen: @case("naam") boven een setup-functie.
+"""
+import random
+import timeit
+
+import headless  # SDL dummy drivers VOOR de game-modules
+
+import pygame
+
+CASES: dict = {}
+
+
+def case(name: str):
+    def deco(setup):
+        CASES[name] = setup
+        return setup
+    return deco
+
+
+# ----------------------------------
+# ANIMATION
+# ----------------------------------
+@case("animator.update+get_image")
+def _animator():
+    import config
+    from animation import Animator, build_animations
+
+    cfg = config.ZOMBIE
+    anims = build_animations(cfg["anims"], int(cfg.get("scale", 2)))
+    anim = Animator(anims, "walk", fps=int(cfg.get("fps", 10)))
+
+    def run():
+        anim.update(1.0 / 60.0)
+        anim.get_image(True)
+    return run
+
+
+# ----------------------------------
+# PICKUPS
+# ----------------------------------
+def _make_coins(n: int):
+    from pickups import CoinPickup
+
+    rng = random.Random(1)
+    coins = [CoinPickup(rng.uniform(0, 6000), rng.uniform(300, 600), value=1, rng=rng) for _ in range(n)]
+    for c in coins:
+        c.lifetime = 1e9  # niet laten verlopen tijdens de meting
+    return coins
+
+
+class _FarPlayer:
+    """Player buiten magnet range: pickups blijven vallen / bobben."""
+
+    def __init__(self):
+        self.rect = pygame.Rect(-100000, 0, 64, 64)
+
+
+@case("pickups.update[200]")
+def _pickups_update():
+    coins = _make_coins(200)
+    player = _FarPlayer()
+
+    def run():
+        for c in coins:
+            c.update(1.0 / 60.0, player)
+
+    for _ in range(120):  # eerst laten landen: meet de steady state (bobbing)
+        run()
+    return run
+
+
+@case("pickup_field.update[200]")
+def _pickup_field_update():
+    from pickup_field import PickupField
+
+    if not PickupField.available():
+        return None
+
+    coins = _make_coins(200)
+    field = PickupField()
+    field.bind(coins)
+    player = _FarPlayer()
+
+    def run():
+        field.update(1.0 / 60.0, player)
+
+    for _ in range(120):
+        run()
+    return run
+
+
+# ----------------------------------
+# COLLISIONS
+# ----------------------------------
+@case("collision.nested[200]")
+def _collision_nested():
+    from benchmarks.bench_collision import make_entities, nested_loop
+
+    enemies, projectiles = make_entities(200)
+    return lambda: nested_loop(projectiles, enemies)  # baseline voor collision.world
+
+
+@case("collision.world[200]")
+def _collision_world():
+    from benchmarks.bench_collision import make_entities, collision_world
+    from collision import CollisionWorld
+
+    enemies, projectiles = make_entities(200)
+    world = CollisionWorld()
+
+    def run():
+        collision_world(world, projectiles, enemies)
+    return run
+
+
+# ----------------------------------
+# SPAWN / LOOT
+# ----------------------------------
+@case("spawner._pick_enemy_spec")
+def _pick_enemy_spec():
+    import config
+    from spawner import EnemySpawner
+
+    spawner = EnemySpawner(pool=config.ENEMY_POOL, cfg_module=config, spawn_y=680, rng=random.Random(1))
+    return spawner._pick_enemy_spec
+
+
+class _DeadEnemy:
+    def __init__(self):
+        self.rect = pygame.Rect(600, 400, 128, 128)
+        self.cfg = {}
+        self._loot_dropped = False
+
+
+@case("loot.on_enemy_death")
+def _loot():
+    from loot_system import LootSystem
+
+    loot = LootSystem(rng=random.Random(1), pickup_rng=random.Random(2))
+    enemy = _DeadEnemy()
+    pickups = []
+
+    def run():
+        enemy._loot_dropped = False
+        pickups.clear()
+        loot.on_enemy_death(enemy, pickups)
+    return run
+
+
+# ----------------------------------
+# ENEMY FX
+# ----------------------------------
+def _zombie_frame():
+    import config
+    import entities.enemies  # registreert enemy classes
+    from entities.enemies.zombie import Zombie
+
+    z = Zombie(600, 680, config.ZOMBIE)
+    return z.anim.get_image(True)
+
+
+@case("enemy_fx.stun_frame[cold]")
+def _stun_cold():
+    from entities.enemies import enemy_fx
+
+    img = _zombie_frame()
+
+    def run():
+        enemy_fx.clear_cache()
+        enemy_fx.stun_frame(img)
+    return run
+
+
+@case("enemy_fx.stun_frame[hot]")
+def _stun_hot():
+    from entities.enemies.enemy_fx import stun_frame
+
+    img = _zombie_frame()
+    stun_frame(img)
+    return lambda: stun_frame(img)
+
+
+# ----------------------------------
+# ENTITY DRAW (Surface vs eigen RenderQueue; beide met camera culling)
+# ----------------------------------
+def _horde_session():
+    from game_session import GameSession
+    from benchmarks.horde import Horde
+
+    session = GameSession(seed=1)
+    Horde(session, enemies=150, books=200, coins=600).top_up()
+    return session
+
+
+# draw_entities(Surface) gaat intern ook via een RenderQueue (+ atlas frames
+# kunnen niet direct geblit worden): alleen het queue pad is een zinnige case
+@case("draw_entities[queue]")
+def _draw_queue():
+    from render import RenderQueue, ENTITY_LAYERS
+
+    session = _horde_session()
+    queue = RenderQueue(pygame.display.get_surface(), ENTITY_LAYERS)
+
+    def run():
+        session.draw_entities(queue)
+        queue.flush()
+    return run
+
+
+# ----------------------------------
+# UI
+# ----------------------------------
+@case("dialogue._wrap")
+def _dialogue_wrap():
+    from ui.dialogue_ui import DialogueUI
+
+    ui = DialogueUI(pygame.display.get_surface())
+    text = (
+        "The bell has not rung yet, but the halls are already full of things "
+        "that should not be here. Keep your books close and your head down."
+    )
+    return lambda: ui._wrap(text, 900)
+
+
+@case("statbar.draw")
+def _statbar_draw():
+    from ui.ui_statbar import StatBarUI
+
+    screen = pygame.display.get_surface()
+    ui = StatBarUI()
+    ui.set_values(hp=120, mana=30, max_hp=200, max_mana=50)
+    ui.update(1.0 / 60.0)
+    return lambda: ui.draw(screen)
+
+
+@case("inventory.draw")
+def _inventory_draw():
+    import config
+    from entities import Player
+    from ui.inventory_ui import InventoryUI
+
+    screen = pygame.display.get_surface()
+    ui = InventoryUI(screen)
+    ui.visible = True
+    player = Player(640, 680, config.PLAYER, rng=random.Random(1))
+    player.inventory = {"apple": 3, "hp_potion": 1}
+    return lambda: ui.draw(player, config)
+
+
+@case("menu.draw")
+def _menu_draw():
+    from ui.menu_ui import MenuUI
+
+    ui = MenuUI(pygame.display.get_surface())
+    return ui.draw
+
+
+# ----------------------------------
+# RUNNER
+# ----------------------------------
+def run_case(fn, repeat: int = 5, min_time: float = 0.2) -> dict:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(number, int(number * min_time / 0.2))
+    times = sorted(t / number for t in timer.repeat(repeat=repeat, number=number))
+    return {
+        "us": times[0] * 1e6,
+        "median_us": times[len(times) // 2] * 1e6,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run_all(selected=None, repeat: int = 5, min_time: float = 0.2, log=print) -> dict:
+    headless.init((1280, 720))
+
+    results = {}
+    for name, setup in CASES.items():
+        if selected and not any(s in name for s in selected):
+            continue
+        fn = setup()
+        if fn is None:
+            log(f"  {name:<32} skipped")
+            continue
+        res = run_case(fn, repeat=repeat, min_time=min_time)
+        results[name] = res
+        log(f"  {name:<32} {res['us']:>10.2f} us")
+    return results
@@ -0,0 +1,161 @@
+# bundle.py
+"""
+Asset bundle: alle files onder assets/ in 1 bestand met een offset index.
+
+Runtime wordt de bundle ge-mmapt; entries worden gedecodeerd vanuit
+zero-copy memoryview slices (file-like reader, geen kopie van de bundle),
+dus 1 open + een aaneengesloten read patroon i.p.v. ~100 losse files.
+
+    python bundle.py build                      # assets/ -> assets.bundle
+    python bundle.py list assets.bundle
+    python main.py --bundle assets.bundle       # assets.load_* lezen uit de bundle
+
+Bestandsformaat (little endian):
+    header: b"QBBA", u16 version, u64 index offset, u64 index size
+    data:   de file bytes achter elkaar (16-byte aligned)
+    index:  utf-8 JSON {path: [offset, size]} (paths zoals in config: "assets/...")
+"""
+import argparse
+import io
+import json
+import mmap
+import os
+import struct
+
+MAGIC = b"QBBA"
+VERSION = 1
+ALIGN = 16
+
+_HEADER = struct.Struct("<4sHQQ")
+
+# .DS_Store e.d. horen niet in de bundle
+BUNDLE_EXTS = (".png", ".jpg", ".jpeg", ".bmp", ".wav", ".mp3", ".ogg")
+
+
+# ----------------------------------
+# BUILD
+# ----------------------------------
+def build(src: str = "assets", out: str = "assets.bundle") -> dict:
+    """Pak src/ in tot 1 bundle. Geeft de index terug."""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(src):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.lower().endswith(BUNDLE_EXTS):
+                paths.append(os.path.join(dirpath, name).replace(os.sep, "/"))
+
+    index = {}
+    with open(out, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, 0))  # index offset volgt na de data
+        for path in paths:
+            pad = -f.tell() % ALIGN
+            if pad:
+                f.write(b"\0" * pad)
+            with open(path, "rb") as src_f:
+                data = src_f.read()
+            index[path] = [f.tell(), len(data)]
+            f.write(data)
+
+        raw = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        index_off = f.tell()
+        f.write(raw)
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, index_off, len(raw)))
+    return index
+
+
+# ----------------------------------
+# RUNTIME
+# ----------------------------------
+class _SliceReader(io.RawIOBase):
+    """Read-only file object over een memoryview slice (seek/tell voor SDL_image/mixer)."""
+
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buf) -> int:
+        n = min(len(buf), len(self._view) - self._pos)
+        if n <= 0:
+            return 0
+        buf[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class AssetBundle:
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+
+        magic, version, index_off, index_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: geen asset bundle")
+        if version != VERSION:
+            raise ValueError(f"{path}: bundle versie {version} (verwacht {VERSION})")
+
+        raw = self._view[index_off:index_off + index_len]
+        self.index: dict[str, list[int]] = json.loads(bytes(raw).decode("utf-8"))
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def names(self) -> list[str]:
+        return list(self.index)
+
+    def view(self, path: str) -> memoryview:
+        """Zero-copy slice van de entry (KeyError als hij er niet in zit)."""
+        off, size = self.index[path]
+        return self._view[off:off + size]
+
+    def open(self, path: str) -> _SliceReader:
+        """File-like object voor pygame.image.load / mixer.Sound / mixer.music.load."""
+        return _SliceReader(self.view(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Asset bundle tool")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p_build = sub.add_parser("build", help="pak assets/ in tot 1 bundle")
+    p_build.add_argument("--src", default="assets")
+    p_build.add_argument("--out", default="assets.bundle")
+
+    p_list = sub.add_parser("list", help="toon de index van een bundle")
+    p_list.add_argument("bundle")
+
+    args = parser.parse_args()
+    if args.cmd == "build":
+        index = build(args.src, args.out)
+        total = sum(size for _, size in index.values())
+        print(f"{len(index)} files, {total / (1024 * 1024):.1f} MB -> {args.out}")
+    else:
+        b = AssetBundle(args.bundle)
+        for name, (off, size) in b.index.items():
+            print(f"{off:>10}  {size:>9}  {name}")
+
+
+if __name__ == "__main__":
+    main()
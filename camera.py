@@ -0,0 +1,60 @@
+# camera.py
+"""
+Horizontale camera over de wereld (WORLD_WIDTH breed, scherm = view_width).
+
+Alle gameplay rekent in wereld-coordinaten; alleen bij het tekenen gaat er
+camera.x af (RenderQueue layer offset, zie GameSession.draw_entities).
+
+    camera.follow(player.rect.centerx)
+    screen_x = camera.to_screen_x(world_x)
+"""
+import pygame
+
+
+class Camera:
+    def __init__(self, view_width: int, world_width: int):
+        self.view_width = int(view_width)
+        self.world_width = max(int(world_width), self.view_width)
+        self.x = 0  # linkerrand van het beeld in wereld-x (hele pixels: geen jitter)
+        self.prev_x = 0  # x voor de laatste follow() (render interpolatie)
+
+    # -------------------------
+    # FOLLOW
+    # -------------------------
+    def follow(self, target_x: float, snap: bool = False):
+        """Centreer op target_x, geclampt aan de wereldranden. snap: niet interpoleren."""
+        x = int(round(target_x - self.view_width / 2))
+        x = max(0, min(self.world_width - self.view_width, x))
+        self.prev_x = x if snap else self.x
+        self.x = x
+
+    def lerp_x(self, alpha: float) -> int:
+        """Camera x tussen de vorige en huidige stap (alpha 0..1)."""
+        if alpha >= 1.0:
+            return self.x
+        return int(round(self.prev_x + (self.x - self.prev_x) * alpha))
+
+    # -------------------------
+    # TRANSFORMS
+    # -------------------------
+    def to_screen_x(self, world_x: float) -> float:
+        return world_x - self.x
+
+    def to_world_x(self, screen_x: float) -> float:
+        return screen_x + self.x
+
+    # -------------------------
+    # CULLING
+    # -------------------------
+    def visible(self, rect: pygame.Rect, margin: int = 0) -> bool:
+        """True als rect (wereld) horizontaal (deels) in beeld valt."""
+        return rect.right > self.x - margin and rect.left < self.x + self.view_width + margin
+
+    def distance(self, rect: pygame.Rect) -> int:
+        """Horizontale afstand van rect tot de rand van het beeld (0 = in beeld)."""
+        if rect.right <= self.x:
+            return self.x - rect.right
+        right = self.x + self.view_width
+        if rect.left >= right:
+            return rect.left - right
+        return 0
@@ -0,0 +1,79 @@
+# collision.py
+from heapq import heappop, heappush
+from operator import itemgetter
+
+
+class CollisionWorld:
+    """
+    Broad-phase voor een side-scroller op 1 grondlijn.
+
+    Elke layer ("enemies", "projectiles", "pickups", ...) is een lijst objecten
+    met een .rect. candidate_pairs() doet een sort-and-sweep op x, dus alleen
+    paren die op de x-as overlappen komen terug (ipv elk paar in een nested loop).
+    """
+
+    def __init__(self):
+        self._layers: dict[str, list] = {}
+
+    def clear(self):
+        self._layers.clear()
+
+    def set_layer(self, name: str, objs: list):
+        """Registreer de (live) lijst van een layer voor deze frame."""
+        self._layers[name] = objs
+
+    def add(self, name: str, obj):
+        self._layers.setdefault(name, []).append(obj)
+
+    def get_layer(self, name: str) -> list:
+        return self._layers.get(name, [])
+
+    # -------------------------
+    # QUERIES
+    # -------------------------
+    def candidate_pairs(self, layer_a: str, layer_b: str) -> list[tuple]:
+        """
+        Alle (a, b) met a uit layer_a en b uit layer_b waarvan de rects
+        op de x-as overlappen. y wordt NIET gecheckt (zie collisions()).
+        """
+        return self._sweep(layer_a, layer_b, check_y=False)
+
+    def collisions(self, layer_a: str, layer_b: str) -> list[tuple]:
+        """Zoals candidate_pairs(), maar alleen paren die echt colliden (colliderect)."""
+        return self._sweep(layer_a, layer_b, check_y=True)
+
+    def _sweep(self, layer_a: str, layer_b: str, check_y: bool) -> list[tuple]:
+        objs_a = self._layers.get(layer_a)
+        objs_b = self._layers.get(layer_b)
+        if not objs_a or not objs_b:
+            return []
+
+        # (left, side, right, top, bottom, obj) - gesorteerd op left
+        events = []
+        for side, objs in ((0, objs_a), (1, objs_b)):
+            for o in objs:
+                r = o.rect
+                if r.width > 0 and r.height > 0:
+                    events.append((r.left, side, r.right, r.top, r.bottom, o))
+        events.sort(key=itemgetter(0))
+
+        # actieve intervals per kant als min-heap op right: (right, seq, top, bottom, obj)
+        active = ([], [])
+        out = []
+        append = out.append
+
+        for seq, (left, side, right, top, bottom, obj) in enumerate(events):
+            other = active[1 - side]
+
+            # intervals die al voorbij zijn eruit (rect.right is exclusief)
+            while other and other[0][0] <= left:
+                heappop(other)
+
+            for _, _, o_top, o_bottom, o in other:
+                if check_y and (o_top >= bottom or top >= o_bottom):
+                    continue
+                append((obj, o) if side == 0 else (o, obj))
+
+            heappush(active[side], (right, seq, top, bottom, obj))
+
+        return out
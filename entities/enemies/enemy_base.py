@@ -1,6 +1,8 @@
 # entities/enemies/enemy_base.py
 import pygame
-from animation import SpriteSheet, Animator
+from animation import Animator, build_animations
+from atlas import frame_size
+from entities.enemies.enemy_fx import blit_faded
 
 
 class EnemyBase:
@@ -32,26 +34,14 @@ class EnemyBase:
         scale = int(config.get("scale", 2))
         fps = int(config.get("fps", 10))
 
-        animations = {}
-        for name, a in config["anims"].items():
-            sheet = SpriteSheet(a["sheet"])
-            frames = a["frames"]
-            fw = sheet.sheet.get_width() // frames
-            fh = sheet.sheet.get_height()
-
-            right = sheet.slice_row(0, frames, fw, fh, scale)
-            left = [pygame.transform.flip(f, True, False) for f in right]
-            animations[name] = {
-                "right": right,
-                "left": left,
-                "loop": a.get("loop", True),
-            }
+        # frames komen uit de shared cache (geen slice/scale/flip per spawn)
+        animations = build_animations(config["anims"], scale)
 
         self.anim = Animator(animations, default="idle", fps=fps)
 
         # position
         self.image = self.anim.get_image(self.facing_right)
-        self.rect = self.image.get_rect()
+        self.rect = pygame.Rect((0, 0), frame_size(self.image))  # volle frame (atlas frames zijn bijgesneden)
         self.rect.midbottom = (x, y)
         self.pos = pygame.Vector2(self.rect.midbottom)
 
@@ -128,7 +118,6 @@ class EnemyBase:
 
         # ✅ apply fade when dead
         if self.dead and self.alpha < 255:
-            img = img.copy()
-            img.set_alpha(self.alpha)
+            return blit_faded(screen, img, self.rect, self.alpha)
 
-        screen.blit(img, self.rect)
\ No newline at end of file
+        return screen.blit(img, self.rect)
\ No newline at end of file
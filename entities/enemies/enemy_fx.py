@@ -0,0 +1,63 @@
+# entities/enemies/enemy_fx.py
+"""
+Gedeelde visuele varianten van enemy frames (stun tint) + de death fade.
+
+Frames komen uit de shared frame cache (animation.load_frame_sequence), dus
+alle instances van hetzelfde enemy type delen dezelfde Surface objecten.
+Stun varianten worden 1x per frame gebakken (lazy, bij de eerste stun) en daarna
+door alle instances hergebruikt: geen copy/fill per frame. De death fade is
+een gewone copy + set_alpha per frame (atlas frames zijn al bijgesneden, dus
+die copy is klein; een variant cache leverde niets meer op).
+"""
+import pygame
+
+from atlas import TextureAtlas, frame_offset
+
+# stun look: grayscale + lichte blauwe add
+STUN_TINT = (15, 25, 45)
+
+# frame Surface -> gebakken stun variant (Surface als key houdt de frame levend)
+_stun_cache: dict[pygame.Surface, pygame.Surface] = {}
+
+# stun varianten in een eigen atlas: clear_cache() geeft die ruimte weer vrij
+_stun_atlas = TextureAtlas(page_size=1024)
+
+
+def _bake_stun(surf: pygame.Surface) -> pygame.Surface:
+    s = surf.convert_alpha()
+    arr = pygame.surfarray.array3d(s)
+
+    gray = (arr[:, :, 0] * 0.299 + arr[:, :, 1] * 0.587 + arr[:, :, 2] * 0.114).astype(arr.dtype)
+    arr[:, :, 0] = gray
+    arr[:, :, 1] = gray
+    arr[:, :, 2] = gray
+
+    out = pygame.surfarray.make_surface(arr).convert_alpha()
+    pygame.surfarray.pixels_alpha(out)[:, :] = pygame.surfarray.array_alpha(s)
+
+    out.fill(STUN_TINT, special_flags=pygame.BLEND_RGB_ADD)
+    return out
+
+
+def stun_frame(surf: pygame.Surface) -> pygame.Surface:
+    """Gestunde variant van een animatie frame (gedeeld, niet aanpassen)."""
+    out = _stun_cache.get(surf)
+    if out is None:
+        out = _stun_cache[surf] = _stun_atlas.add(_bake_stun(surf), trim=False, like=surf)
+    return out
+
+
+def blit_faded(screen, surf: pygame.Surface, rect: pygame.Rect, alpha: int):
+    """
+    Death fade: copy met set_alpha (het gedeelde frame zelf niet aanpassen).
+    De copy is geen atlas frame meer, dus de trim offset komt er hier bij.
+    """
+    faded = surf.copy()
+    faded.set_alpha(alpha)
+    ox, oy = frame_offset(surf)
+    return screen.blit(faded, (rect.x + ox, rect.y + oy))
+
+
+def clear_cache():
+    _stun_cache.clear()
+    _stun_atlas.clear()
@@ -2,6 +2,7 @@
 import pygame
 from entities.enemies.enemy_base import EnemyBase
 from entities.enemies.registry import register_enemy
+from entities.enemies.enemy_fx import stun_frame, blit_faded
 
 
 class Hellhound(EnemyBase):
@@ -23,9 +24,6 @@ class Hellhound(EnemyBase):
         self.stun_duration = float(config.get("stun_duration", 0.70))
         self.stun_anim_speed = float(config.get("stun_anim_speed", 0.20))
 
-        # --- grayscale cache (per surface id) ---
-        self._gray_cache: dict[int, pygame.Surface] = {}
-
     # -------------------------
     # STUN
     # -------------------------
@@ -124,49 +122,21 @@ class Hellhound(EnemyBase):
             self.anim.play("walk")
             self.anim.update(dt)
 
-    # -------------------------
-    # GRAYSCALE HELP
-    # -------------------------
-    def _get_grayscale(self, surf: pygame.Surface) -> pygame.Surface:
-        key = id(surf)
-        cached = self._gray_cache.get(key)
-        if cached is not None:
-            return cached
-
-        s = surf.convert_alpha()
-        arr = pygame.surfarray.array3d(s)
-
-        gray = (arr[:, :, 0] * 0.299 + arr[:, :, 1] * 0.587 + arr[:, :, 2] * 0.114).astype(arr.dtype)
-        arr[:, :, 0] = gray
-        arr[:, :, 1] = gray
-        arr[:, :, 2] = gray
-
-        gray_surf = pygame.surfarray.make_surface(arr).convert_alpha()
-        alpha = pygame.surfarray.array_alpha(s)
-        pygame.surfarray.pixels_alpha(gray_surf)[:, :] = alpha
-
-        self._gray_cache[key] = gray_surf
-        return gray_surf
-
     # -------------------------
     # DRAW
     # -------------------------
     def draw(self, screen: pygame.Surface):
         img = self.anim.get_image(self.facing_right)
 
-        # stun tint (grey + slight blue add) — ook tijdens stun zichtbaar
+        # stun tint (grey + slight blue add) — 1x gebakken per frame, gedeeld door alle instances
         if self.stun_timer > 0 and (not self.dead):
-            gray = self._get_grayscale(img)
-            fx = gray.copy()
-            fx.fill((15, 25, 45), special_flags=pygame.BLEND_RGB_ADD)
-            img = fx
+            img = stun_frame(img)
 
         # ✅ death fade komt uit EnemyBase (self.alpha), dus respecteer dat
         if self.dead and getattr(self, "alpha", 255) < 255:
-            img = img.copy()
-            img.set_alpha(self.alpha)
+            return blit_faded(screen, img, self.rect, self.alpha)
 
-        screen.blit(img, self.rect)
+        return screen.blit(img, self.rect)
 
 
 register_enemy("hellhound", Hellhound)
\ No newline at end of file
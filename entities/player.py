@@ -1,6 +1,7 @@
 # entities/player.py
 import pygame
-from animation import SpriteSheet, Animator
+from animation import Animator, build_animations
+from atlas import frame_offset, frame_size
 from movement import Movement
 from projectiles import BookProjectile
 
@@ -9,7 +10,7 @@ from entities.player_mana import ManaSystem
 
 
 class Player:
-    def __init__(self, x: int, y: int, config: dict):
+    def __init__(self, x: int, y: int, config: dict, rng=None):
         # -------------------------
         # CORE STATE
         # -------------------------
@@ -52,6 +53,7 @@ class Player:
             cooldown=1.0,
             shield_scale=0.1,
             pushback_force=300.0,
+            rng=rng,
         )
 
         self.mana_sys = ManaSystem(
@@ -60,6 +62,9 @@ class Player:
             regen=2.0,
         )
 
+        # optioneel: ProjectilePool (main zet deze), anders new per schot
+        self.projectile_pool = None
+
         # -------------------------
         # FEEDBACK TIMERS
         # -------------------------
@@ -81,15 +86,7 @@ class Player:
         scale = config.get("scale", 2)
         fps = config.get("fps", 12)
 
-        animations = {}
-        for name, a in config["anims"].items():
-            sheet = SpriteSheet(a["sheet"])
-            frames = a["frames"]
-            fw = sheet.sheet.get_width() // frames
-            fh = sheet.sheet.get_height()
-            right = sheet.slice_row(0, frames, fw, fh, scale)
-            left = [pygame.transform.flip(f, True, False) for f in right]
-            animations[name] = {"right": right, "left": left, "loop": a.get("loop", True)}
+        animations = build_animations(config["anims"], scale)
 
         self.anim = Animator(animations, default="idle", fps=fps)
 
@@ -98,7 +95,7 @@ class Player:
 
         # position
         self.image = self.anim.get_image(self.facing_right)
-        self.rect = self.image.get_rect()
+        self.rect = pygame.Rect((0, 0), frame_size(self.image))  # volle frame, niet de bijgesneden atlas rect
         self.rect.midbottom = (x, y)
         self.pos = pygame.Vector2(self.rect.midbottom)
 
@@ -140,7 +137,7 @@ class Player:
     def mana_regening(self):
         return self.mana_sys.regening
 
-    def update(self, keys, dt, projectiles, PROJECTILES, ui_block_input=False):
+    def update(self, keys, dt, projectiles, PROJECTILES, ui_block_input=False, mouse_buttons=None):
         # ----------------------
         # TIMERS
         # ----------------------
@@ -158,7 +155,9 @@ class Player:
         # ----------------------
         # READ INPUTS ONCE
         # ----------------------
-        mouse_buttons = pygame.mouse.get_pressed()
+        # mouse_buttons kan van buiten komen (headless / replay)
+        if mouse_buttons is None:
+            mouse_buttons = pygame.mouse.get_pressed()
 
         # ---- BLOCK INPUT ----
         block_now = (mouse_buttons[2] or keys[pygame.K_e]) and (not ui_block_input)
@@ -289,7 +288,11 @@ class Player:
                 direction = 1 if self.facing_right else -1
                 spawn_x = self.rect.centerx + (30 * direction)
                 spawn_y = self.rect.centery + 50
-                projectiles.append(BookProjectile(spawn_x, spawn_y, direction, PROJECTILES["book"]))
+                if self.projectile_pool is not None:
+                    book = self.projectile_pool.acquire(spawn_x, spawn_y, direction)
+                else:
+                    book = BookProjectile(spawn_x, spawn_y, direction, PROJECTILES["book"])
+                projectiles.append(book)
                 self.attack_spawned = True
 
             if self.anim.finished:
@@ -443,8 +446,12 @@ class Player:
         if self.damage_timer > 0:
             flash = img.copy()
             flash.fill((255, 0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-            screen.blit(flash, self.rect)
+            drawn = screen.blit(flash, self.rect.move(frame_offset(img)))  # copy is geen atlas frame meer
         else:
-            screen.blit(img, self.rect)
+            drawn = screen.blit(img, self.rect)
 
-        self.block.draw_shield(screen, self.rect, self.facing_right)
\ No newline at end of file
+        # getekende rect teruggeven (dirty-rect rendering)
+        shield = self.block.draw_shield(screen, self.rect, self.facing_right)
+        if drawn is not None and shield is not None:
+            return drawn.union(shield)
+        return drawn if drawn is not None else shield
\ No newline at end of file
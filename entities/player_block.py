@@ -21,9 +21,13 @@ class BlockSystem:
         fail_stun=0.40,
         cooldown=1.0,
         pushback_force=300.0,
+        rng=None,
     ):
         self.blocking = False
 
+        # stream "block" (random_streams.py)
+        self.rng = rng if rng is not None else random
+
         self.block_chance = block_chance
         self.fail_stun = fail_stun
 
@@ -66,7 +70,7 @@ class BlockSystem:
         if not self.blocking:
             return BlockResult.NONE
 
-        if random.random() <= self.block_chance:
+        if self.rng.random() <= self.block_chance:
             self.shield_timer = self.shield_duration
             self.hit_pop_timer = self.hit_pop_duration
             return BlockResult.SUCCESS
@@ -92,4 +96,4 @@ class BlockSystem:
         direction = 1 if facing_right else -1
         shield_x = player_rect.centerx + direction * 35
         shield_y = player_rect.centery - 20
-        screen.blit(s, s.get_rect(center=(shield_x, shield_y)))
\ No newline at end of file
+        return screen.blit(s, s.get_rect(center=(shield_x, shield_y)))
\ No newline at end of file
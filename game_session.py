@@ -0,0 +1,353 @@
+# game_session.py
+import pygame
+import config
+import entities.enemies  # IMPORTANT: registreert enemy classes
+
+from entities import Player
+from spawner import EnemySpawner
+from wave_system import WaveSystem
+from loot_system import LootSystem
+from projectiles import ProjectilePool
+from collision import CollisionWorld
+from pickup_field import PickupField
+from random_streams import RandomStreams
+from profiler import NULL_PROFILER
+from render import RenderQueue, ENTITY_LAYERS
+from camera import Camera
+
+# enemies verder dan dit buiten beeld: 1 op FAR_UPDATE_EVERY stappen updaten
+# (~10 Hz bij de 120 Hz simulatie) met de opgespaarde dt, gespreid over de enemies
+FAR_DISTANCE = 400
+FAR_UPDATE_EVERY = 12
+
+# sprites tot zo ver buiten beeld nog tekenen (shield/fx steken buiten de rect uit)
+CULL_MARGIN = 64
+
+# render interpolatie: grotere sprongen per stap (spawn, pool hergebruik) niet interpoleren
+LERP_MAX = 96
+
+
+class KeyState:
+    """
+    Vervanger voor pygame.key.get_pressed() (headless / replay):
+    keys[pygame.K_d] -> True als K_d in pressed zit.
+    """
+
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key) -> bool:
+        return key in self.pressed
+
+
+class InputState:
+    """Alles wat de gameplay-update per frame van input nodig heeft."""
+
+    def __init__(
+        self,
+        keys=None,
+        mouse_buttons=(False, False, False),
+        mouse_pos=(0, 0),
+        ui_block_input: bool = False,
+    ):
+        self.keys = keys if keys is not None else KeyState()
+        self.mouse_buttons = tuple(mouse_buttons)
+        self.mouse_pos = tuple(mouse_pos)
+        self.ui_block_input = bool(ui_block_input)
+
+    @classmethod
+    def from_pygame(cls, ui_block_input: bool = False):
+        return cls(
+            keys=pygame.key.get_pressed(),
+            mouse_buttons=pygame.mouse.get_pressed(),
+            mouse_pos=pygame.mouse.get_pos(),
+            ui_block_input=ui_block_input,
+        )
+
+
+class GameSession:
+    """
+    PLAY-state van de game zonder rendering of echte input:
+    wave, player, spawner, enemies, projectiles, pickups, collisions, loot, cleanup.
+
+    main.py roept step() per vaste simulatie-stap aan (timestep.py, 120 Hz);
+    headless runs doen hetzelfde met dezelfde dt en een eigen InputState
+    (zie headless.py).
+    """
+
+    def __init__(
+        self,
+        world_width: int = 6000,
+        view_width: int = 1280,
+        ground_y: int = 680,
+        use_pickup_field: bool = True,
+        seed: int | None = None,
+        interpolate: bool = False,
+    ):
+        self.world_width = int(world_width)
+        self.view_width = int(view_width)
+        self.ground_y = int(ground_y)
+
+        # ----------------------------------
+        # SYSTEMS
+        # ----------------------------------
+        self.spawner = EnemySpawner(
+            pool=config.ENEMY_POOL,
+            cfg_module=config,
+            spawn_y=self.ground_y,
+            interval_min=1.2,
+            interval_max=2.5,
+            max_enemies=6,
+        )
+        self.wave_sys = WaveSystem(waves=config.WAVES, break_time=4.0)
+        self.loot_sys = LootSystem()
+
+        # books worden hergebruikt i.p.v. per schot gealloceerd
+        self.projectile_pool = ProjectilePool(config.PROJECTILES["book"])
+
+        # broad-phase (sort-and-sweep op x) voor projectile x enemy
+        self.collision_world = CollisionWorld()
+
+        # pickups gevectoriseerd updaten als numpy er is (anders per object)
+        self.pickup_field = PickupField() if (use_pickup_field and PickupField.available()) else None
+
+        # main.py zet hier een FrameProfiler; step() doet per fase een lap()
+        self.profiler = NULL_PROFILER
+
+        # wereld -> scherm (volgt de player); draw_entities tekent alleen wat in beeld is
+        self.camera = Camera(self.view_width, self.world_width)
+        self._queue = None  # RenderQueue voor draw_entities(Surface)
+        self.drawn_count = 0
+
+        # interpolate: step() onthoudt de vorige posities; draw_entities tekent op
+        # render_alpha tussen vorige en huidige stap (main.py zet die per frame)
+        self.interpolate = bool(interpolate)
+        self.render_alpha = 1.0
+
+        self.reset(seed)
+
+    # -------------------------
+    # RESET
+    # -------------------------
+    def reset(self, seed: int | None = None):
+        """Nieuwe run. Zelfde seed + zelfde input => exact dezelfde run."""
+        self.streams = RandomStreams(seed)
+        self.seed = self.streams.seed
+
+        self.spawner.rng = self.streams.get("spawner")
+        self.loot_sys.rng = self.streams.get("loot")
+        self.loot_sys.pickup_rng = self.streams.get("pickups")
+
+        self.spawner.reset()
+        self.wave_sys.start()
+
+        self.player = Player(self.view_width // 2, self.ground_y, config.PLAYER, rng=self.streams.get("block"))
+        self.player.projectile_pool = self.projectile_pool
+        self.camera.follow(self.player.rect.centerx, snap=True)
+
+        if hasattr(self, "projectiles"):
+            # restart: levende books terug in de pool i.p.v. weggooien
+            self.projectile_pool.release_all(self.projectiles)
+        self.projectiles = []
+        self.enemies = []
+        self.pickups = []
+        if self.pickup_field is not None:
+            self.pickup_field.bind(self.pickups)
+
+        self.time = 0.0
+        self.frames = 0
+
+        # stats (balance / regressie runs)
+        self.waves_cleared = 0
+        self.wave_times = []      # seconden per gecleare wave (FIGHT -> BREAK)
+        self.coins_earned = 0
+        self.damage_taken = 0
+        self._wave_start = 0.0
+
+    # -------------------------
+    # STEP (1 gameplay frame)
+    # -------------------------
+    def step(self, dt: float, inp: InputState):
+        prof = self.profiler
+        player = self.player
+        hp_before = player.hp
+        coins_before = getattr(player, "coins", 0)
+        was_fight = self.wave_sys.is_fight()
+        if self.interpolate:
+            self._store_prev_positions()
+
+        # wave
+        self.wave_sys.update(dt, self.spawner, self.enemies)
+        if was_fight and not self.wave_sys.is_fight():
+            self.waves_cleared += 1
+            self.wave_times.append(self.time - self._wave_start)
+        elif self.wave_sys.is_fight() and not was_fight:
+            self._wave_start = self.time
+        prof.lap("wave")
+
+        # player
+        player.update(
+            inp.keys, dt, self.projectiles, config.PROJECTILES, inp.ui_block_input,
+            mouse_buttons=inp.mouse_buttons,
+        )
+
+        # keep player inside world
+        MARGIN_X = 5
+        if player.rect.centerx < MARGIN_X:
+            player.rect.centerx = MARGIN_X
+        if player.rect.centerx > self.world_width - MARGIN_X:
+            player.rect.centerx = self.world_width - MARGIN_X
+
+        # sync float-pos met de (geclampte) rect
+        player.pos.x = float(player.rect.centerx)
+        self.camera.follow(player.rect.centerx)
+        prof.lap("player")
+
+        # spawn
+        if (not player.dead) and self.wave_sys.can_spawn():
+            before = len(self.enemies)
+            self.spawner.update(dt, player, self.enemies, world_width=self.world_width)
+            spawned_now = len(self.enemies) - before
+            if spawned_now > 0:
+                self.wave_sys.on_spawned(spawned_now)
+        prof.lap("spawner")
+
+        # enemies / projectiles (ver buiten beeld: minder vaak, met opgespaarde dt)
+        camera = self.camera
+        phase = self.frames
+        for i, e in enumerate(self.enemies):
+            far_dt = getattr(e, "_far_dt", 0.0)
+            if (phase + i) % FAR_UPDATE_EVERY and camera.distance(e.rect) > FAR_DISTANCE:
+                e._far_dt = far_dt + dt
+                continue
+            e._far_dt = 0.0
+            e.update(dt + far_dt, player)
+        prof.lap("enemies")
+        for p in self.projectiles:
+            p.update(dt)
+        prof.lap("projectiles")
+
+        # pickups
+        if self.pickup_field is not None:
+            for c in self.pickup_field.update(dt, player):
+                player.coins = getattr(player, "coins", 0) + getattr(c, "value", 1)
+        else:
+            for c in self.pickups:
+                was_collected = getattr(c, "collected", False)
+                c.update(dt, player)
+                if (not was_collected) and getattr(c, "collected", False):
+                    player.coins = getattr(player, "coins", 0) + getattr(c, "value", 1)
+        prof.lap("pickups")
+
+        # collisions
+        world = self.collision_world
+        world.set_layer("enemies", self.enemies)
+        world.set_layer("projectiles", self.projectiles)
+        world.set_layer("pickups", self.pickups)
+
+        for p, e in world.collisions("projectiles", "enemies"):
+            if not getattr(e, "dead", False):
+                dmg = config.DAMAGE["book"] + getattr(player, "damage_bonus", 0)
+                e.take_damage(dmg)
+                p.age = p.lifetime
+        prof.lap("collisions")
+
+        # loot
+        for e in self.enemies:
+            if getattr(e, "dead", False) and not getattr(e, "_loot_dropped", False):
+                self.loot_sys.on_enemy_death(e, self.pickups)
+        prof.lap("loot")
+
+        # cleanup
+        self.projectile_pool.release_dead(self.projectiles)
+        self.enemies = [e for e in self.enemies if not getattr(e, "remove", False)]
+        if self.pickup_field is not None:
+            self.pickup_field.compact()
+        else:
+            self.pickups = [c for c in self.pickups if not getattr(c, "remove", False) and not c.is_dead()]
+
+        self.damage_taken += max(0, hp_before - player.hp)
+        self.coins_earned += max(0, getattr(player, "coins", 0) - coins_before)
+
+        self.time += dt
+        self.frames += 1
+        prof.lap("cleanup")
+
+    def _store_prev_positions(self):
+        self.player._prev_xy = self.player.rect.topleft
+        for group in (self.enemies, self.projectiles, self.pickups):
+            for ent in group:
+                ent._prev_xy = ent.rect.topleft
+
+    # -------------------------
+    # DRAW (alleen entities; background/HUD/UI doet main)
+    # -------------------------
+    @property
+    def view_x(self) -> int:
+        """Camera x zoals getekend (geinterpoleerd)."""
+        alpha = self.render_alpha if self.interpolate else 1.0
+        return self.camera.lerp_x(alpha)
+
+    def draw_entities(self, screen) -> list:
+        """
+        Tekent alles wat in beeld is en geeft de getekende rects (scherm) terug
+        (None = niks getekend). screen: Surface, of een render.RenderQueue met
+        ENTITY_LAYERS (dan per layer gebatcht; flush() doet de caller).
+        """
+        queue = screen
+        if not isinstance(queue, RenderQueue):
+            queue = self._queue
+            if queue is None or queue.screen is not screen:
+                queue = self._queue = RenderQueue(screen, ENTITY_LAYERS, track_rects=True)
+
+        view_x = self.view_x
+        queue.set_offset(ENTITY_LAYERS, -view_x)
+        player_t = queue.layer("player")
+        enemy_t = queue.layer("enemies")
+        proj_t = queue.layer("projectiles")
+        pickup_t = queue.layer("pickups")
+
+        # culling op wereld-x (voor de draw() call, niet pas in de queue)
+        left = view_x - CULL_MARGIN
+        right = view_x + self.camera.view_width + CULL_MARGIN
+        alpha = self.render_alpha if self.interpolate else 1.0
+
+        drawn = []
+        for group, target in (
+            ((self.player,), player_t),
+            (self.enemies, enemy_t),
+            (self.projectiles, proj_t),
+            (self.pickups, pickup_t),
+        ):
+            if alpha >= 1.0:
+                for ent in group:
+                    r = ent.rect
+                    if r.right > left and r.left < right:
+                        drawn.append(ent.draw(target))
+            else:
+                self._draw_lerp(group, target, left, right, alpha, drawn)
+        self.drawn_count = len(drawn)
+
+        if queue is not screen:
+            queue.flush()
+        return drawn
+
+    @staticmethod
+    def _draw_lerp(group, target, left: int, right: int, alpha: float, drawn: list):
+        """Teken op de geinterpoleerde positie via de layer offset (rects blijven ongemoeid)."""
+        base_dx, base_dy = target.dx, target.dy
+        back = 1.0 - alpha
+        for ent in group:
+            r = ent.rect
+            if r.right <= left or r.left >= right:
+                continue
+            prev = getattr(ent, "_prev_xy", None)
+            if prev is not None:
+                ox = int(round((prev[0] - r.x) * back))
+                oy = int(round((prev[1] - r.y) * back))
+                if abs(ox) <= LERP_MAX and abs(oy) <= LERP_MAX:
+                    target.dx = base_dx + ox
+                    target.dy = base_dy + oy
+            drawn.append(ent.draw(target))
+            target.dx = base_dx
+            target.dy = base_dy
@@ -0,0 +1,135 @@
+# headless.py
+"""
+Headless simulatie van de PLAY-state (geen venster, geen audio, geen frame cap).
+
+Importeer deze module VOOR andere game-modules: pickups/ui laden sounds bij
+import, dus de SDL dummy drivers moeten al gezet zijn.
+
+    python headless.py --runs 20 --waves 9
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import time
+
+import pygame
+
+from timestep import SIM_DT
+
+_initialized = False
+
+
+def init(size=(1, 1)):
+    """pygame + een (dummy) display, nodig voor convert()/convert_alpha()."""
+    global _initialized
+    if _initialized:
+        return
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode(size)
+    _initialized = True
+
+
+class AutoPilot:
+    """
+    Simpele bot voor headless runs: draait naar de dichtstbijzijnde enemy,
+    loopt tot binnen gooi-afstand en gooit books (attack = edge, dus om de frame).
+    Blokt als een enemy dichtbij aan het aanvallen is.
+    """
+
+    def __init__(self, throw_range: float = 450.0, block_range: float = 130.0):
+        self.throw_range = float(throw_range)
+        self.block_range = float(block_range)
+        self._attack_held = False
+
+    def __call__(self, session):
+        from game_session import InputState, KeyState
+
+        player = session.player
+        pressed = set()
+
+        target = None
+        best = None
+        for e in session.enemies:
+            if getattr(e, "dead", False):
+                continue
+            d = abs(e.rect.centerx - player.rect.centerx)
+            if best is None or d < best:
+                best = d
+                target = e
+
+        if target is not None and not player.dead:
+            want_right = target.rect.centerx > player.rect.centerx
+            move_key = pygame.K_d if want_right else pygame.K_q
+
+            if best <= self.block_range and target.anim.state == "attack":
+                pressed.add(pygame.K_e)
+            elif player.facing_right != want_right or best > self.throw_range:
+                pressed.add(move_key)
+            elif not self._attack_held:
+                pressed.add(pygame.K_RETURN)
+
+        self._attack_held = pygame.K_RETURN in pressed
+        return InputState(keys=KeyState(pressed))
+
+
+def run(session, policy, dt: float = SIM_DT, max_time: float = 900.0, max_waves: int | None = None) -> dict:
+    """Simuleer tot de player dood is, max_waves gecleared zijn of max_time om is."""
+    if max_waves is None:
+        max_waves = len(session.wave_sys.waves)
+
+    while session.time < max_time:
+        session.step(dt, policy(session))
+        if session.player.dead or session.waves_cleared >= max_waves:
+            break
+
+    return {
+        "seed": session.seed,
+        "time": session.time,
+        "frames": session.frames,
+        "waves_cleared": session.waves_cleared,
+        "wave_times": list(session.wave_times),
+        "survived": (not session.player.dead) and session.waves_cleared >= max_waves,
+        "hp": session.player.hp,
+        "coins": session.player.coins,
+        "coins_earned": session.coins_earned,
+        "damage_taken": session.damage_taken,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless PLAY-state simulatie")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--waves", type=int, default=None, help="stop na N gecleare waves (default: alle)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dt", type=float, default=SIM_DT, help="simulatie stap (default: die van het spel)")
+    parser.add_argument("--max-time", type=float, default=900.0, help="max gesimuleerde seconden per run")
+    args = parser.parse_args()
+
+    init()
+    from game_session import GameSession
+
+    session = GameSession()
+    t0 = time.perf_counter()
+    sim_time = 0.0
+    waves = 0
+
+    for i in range(args.runs):
+        session.reset(seed=args.seed + i)
+        res = run(session, AutoPilot(), dt=args.dt, max_time=args.max_time, max_waves=args.waves)
+        sim_time += res["time"]
+        waves += res["waves_cleared"]
+        print(
+            f"run {i}: seed={res['seed']} waves={res['waves_cleared']} survived={res['survived']} "
+            f"hp={res['hp']} coins={res['coins']} sim={res['time']:.1f}s"
+        )
+
+    wall = time.perf_counter() - t0
+    print(f"{args.runs} runs, {waves} waves, {sim_time:.0f}s sim in {wall:.2f}s wall ({sim_time / max(wall, 1e-9):.0f}x realtime)")
+
+
+if __name__ == "__main__":
+    main()
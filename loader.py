@@ -0,0 +1,134 @@
+# loader.py
+"""
+Startup loader: alle images/sounds onder assets/ parallel inlezen + decoderen
+(thread pool) terwijl een laadbalk getekend wordt.
+
+Gedecodeerde images gaan naar assets.add_decoded: de eerste load_image /
+load_scene van dat path (UI constructors, prefetch van enemy sheets) doet
+daarna alleen nog convert/scale op de main thread. Sounds zijn meteen klaar
+en gaan de sound cache in (assets.load_sound).
+
+    loader = StartupLoader(scan_assets("assets", skip=("assets/Sounds/bg_music.mp3",)))
+    loader.run(screen, font)
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import pygame
+
+import assets
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp")
+SOUND_EXTS = (".wav", ".mp3", ".ogg")
+
+
+def scan_assets(root: str = "assets", skip=()) -> list[str]:
+    """
+    Alle image/sound files onder root (gesorteerd; skip = gestreamde muziek e.d.).
+    Met een actieve bundle (assets.use_bundle) de entries daaruit.
+    """
+    skip = {os.path.normpath(p) for p in skip}
+    bundle = assets.active_bundle()
+    if bundle is not None:
+        prefix = root.rstrip("/") + "/"
+        return sorted(
+            p for p in bundle.names()
+            if p.startswith(prefix) and p.lower().endswith(IMAGE_EXTS + SOUND_EXTS)
+            and os.path.normpath(p) not in skip
+        )
+
+    out = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if not name.lower().endswith(IMAGE_EXTS + SOUND_EXTS):
+                continue
+            path = os.path.join(dirpath, name).replace(os.sep, "/")
+            if os.path.normpath(path) not in skip:
+                out.append(path)
+    return out
+
+
+def _decode(path: str):
+    if path.lower().endswith(SOUND_EXTS):
+        assets.add_sound(path, assets.decode_sound(path))
+    else:
+        assets.add_decoded(path, assets.decode_image(path))
+
+
+class StartupLoader:
+    def __init__(self, paths, workers: int | None = None):
+        self.paths = list(paths)
+        self.workers = workers or min(8, (os.cpu_count() or 2) + 2)  # IO-bound: iets meer dan cores
+        self.done = 0
+        self.failed: list[tuple[str, str]] = []
+        self._pool: ThreadPoolExecutor | None = None
+        self._futures = []
+
+    @property
+    def total(self) -> int:
+        return len(self.paths)
+
+    @property
+    def progress(self) -> float:
+        return self.done / self.total if self.paths else 1.0
+
+    def start(self):
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="loader")
+        self._futures = [(p, self._pool.submit(_decode, p)) for p in self.paths]
+
+    def poll(self) -> bool:
+        """Tel afgeronde files; True als alles klaar is."""
+        pending = []
+        for path, fut in self._futures:
+            if not fut.done():
+                pending.append((path, fut))
+                continue
+            self.done += 1
+            err = fut.exception()
+            if err is not None:
+                # niet fataal: de consumer laadt het dan zelf (en crasht daar met de echte fout)
+                self.failed.append((path, str(err)))
+        self._futures = pending
+
+        if not pending and self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        return not pending
+
+    # -------------------------
+    # LAADSCHERM
+    # -------------------------
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font):
+        sw, sh = screen.get_size()
+        screen.fill((10, 10, 10))
+
+        bar = pygame.Rect(0, 0, int(sw * 0.5), 18)
+        bar.center = (sw // 2, sh // 2 + 30)
+        pygame.draw.rect(screen, (60, 60, 60), bar, border_radius=4)
+        fill = bar.copy()
+        fill.w = int(bar.w * self.progress)
+        if fill.w > 0:
+            pygame.draw.rect(screen, (230, 230, 230), fill, border_radius=4)
+
+        text = font.render(f"Loading... {self.done}/{self.total}", True, (230, 230, 230))
+        screen.blit(text, text.get_rect(midbottom=(sw // 2, bar.top - 12)))
+
+    def run(self, screen: pygame.Surface, font: pygame.font.Font, fps: int = 60) -> bool:
+        """Blokkeert tot alles geladen is; False als het venster gesloten werd."""
+        if self._pool is None and not self._futures:
+            self.start()
+
+        frame = 1.0 / fps
+        while not self.poll():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self._pool.shutdown(wait=False, cancel_futures=True)
+                    return False
+            self.draw(screen, font)
+            pygame.display.flip()
+            wait([f for _, f in self._futures], timeout=frame)  # max 1 frame, eerder als alles klaar is
+
+        self.draw(screen, font)
+        pygame.display.flip()
+        return True
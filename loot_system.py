@@ -2,14 +2,61 @@
 import random
 import config
 from pickups import CoinPickup, ItemPickup
+from sampling import AliasTable
 
 
 class LootSystem:
-    def __init__(self, coins_min: int = 0, coins_max: int = 4, item_drop_chance=0.4):
+    def __init__(self, coins_min: int = 0, coins_max: int = 4, item_drop_chance=0.4, rng=None, pickup_rng=None):
         self.coins_min = int(coins_min)
         self.coins_max = int(coins_max)
         self.item_drop_chance = float(item_drop_chance)
 
+        # stream "loot" (random_streams.py)
+        self.rng = rng if rng is not None else random
+        # aparte stream voor de drop-physics van pickups (vx/vy/bob)
+        self.pickup_rng = pickup_rng
+
+        # item distributies, 1x gecompileerd per enemy loot-config
+        # key: de (naam, weight) paren van item_weights (inhoud, niet id(): een in-place
+        # gewijzigde dict krijgt zo een nieuwe tabel) of None voor de defaults uit config.ITEMS
+        self._item_tables: dict[tuple | None, AliasTable | None] = {}
+
+    def _compile_item_table(self, w_override, items: dict):
+        names = []
+        weights = []
+
+        if isinstance(w_override, dict) and len(w_override) > 0:
+            # alleen items die echt bestaan + weight > 0
+            for k, w in w_override.items():
+                if k in items:
+                    w = float(w)
+                    if w > 0:
+                        names.append(k)
+                        weights.append(w)
+        else:
+            # defaults uit ITEMS
+            for k, cfg in items.items():
+                w = float(cfg.get("weight", 1))
+                if w > 0:
+                    names.append(k)
+                    weights.append(w)
+
+        # guard: 
+        if not names or not weights:
+            return None
+
+        return AliasTable(names, weights)
+
+    def _get_item_table(self, w_override, items: dict):
+        if isinstance(w_override, dict) and len(w_override) > 0:
+            key = tuple(w_override.items())  # volgorde telt: bepaalt de volgorde in de AliasTable
+        else:
+            key = None
+
+        if key not in self._item_tables:
+            self._item_tables[key] = self._compile_item_table(w_override, items)
+        return self._item_tables[key]
+
     def on_enemy_death(self, enemy, pickups: list):
 
         # anti-double-drop guard
@@ -26,15 +73,15 @@ class LootSystem:
         if vmax < vmin:
             vmax = vmin
 
-        value = random.randint(vmin, vmax)
+        value = self.rng.randint(vmin, vmax)
         if value > 0:
-            pickups.append(CoinPickup(enemy.rect.centerx, enemy.rect.centery, value=value))
+            pickups.append(CoinPickup(enemy.rect.centerx, enemy.rect.centery, value=value, rng=self.pickup_rng))
 
         # ==========================
         # ITEMS (HP regen)
         # ==========================
         item_chance = float(loot_cfg.get("item_chance", self.item_drop_chance))
-        if random.random() > item_chance:
+        if self.rng.random() > item_chance:
             return
 
         items = getattr(config, "ITEMS", None)
@@ -42,32 +89,11 @@ class LootSystem:
             return
 
         # enemy override weights, anders default uit config.ITEMS["..."]["weight"]
-        w_override = loot_cfg.get("item_weights", None)
-
-        names = []
-        weights = []
-
-        if isinstance(w_override, dict) and len(w_override) > 0:
-            # alleen items die echt bestaan + weight > 0
-            for k, w in w_override.items():
-                if k in items:
-                    w = float(w)
-                    if w > 0:
-                        names.append(k)
-                        weights.append(w)
-        else:
-            # defaults uit ITEMS
-            for k, cfg in items.items():
-                w = float(cfg.get("weight", 1))
-                if w > 0:
-                    names.append(k)
-                    weights.append(w)
-
-        # guard: 
-        if not names or not weights:
+        table = self._get_item_table(loot_cfg.get("item_weights", None), items)
+        if table is None:
             return
 
-        choice = random.choices(names, weights=weights, k=1)[0]
+        choice = table.sample(self.rng)
         cfg = items[choice]
 
-        pickups.append(ItemPickup(enemy.rect.centerx, enemy.rect.centery, cfg))
\ No newline at end of file
+        pickups.append(ItemPickup(enemy.rect.centerx, enemy.rect.centery, cfg, rng=self.pickup_rng))
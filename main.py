@@ -1,13 +1,10 @@
 # main.py
+import argparse
 import pygame
 import config
-import entities.enemies  # IMPORTANT: registreert enemy classes
 
-from entities import Player
+from game_session import GameSession, InputState
 from ui.ui_statbar import StatBarUI
-from spawner import EnemySpawner
-from wave_system import WaveSystem
-from loot_system import LootSystem
 from ui.menu_ui import MenuUI
 from ui.inventory_ui import InventoryUI
 from ui.main_screen import MainScreen
@@ -15,6 +12,35 @@ from dialogue.intro import get_intro_lines
 from ui.dialogue_ui import DialogueUI
 from ui.settings_menu import SettingsMenu
 from ui.profile_menu import ProfileMenu
+from replay import InputRecorder, InputReplay
+from profiler import FrameProfiler
+from tracing import TraceWriter
+from text_cache import render_text
+from timestep import FixedTimestep
+from prefetch import AssetPrefetcher
+from assets import load_scene, load_sound, load_music, use_bundle
+from loader import StartupLoader, scan_assets
+from bake import baked_sheets
+from render import DirtyRectRenderer, RenderQueue, MAIN_LAYERS, blit_scrolled
+
+# ----------------------------------
+# CLI
+# ----------------------------------
+parser = argparse.ArgumentParser(description="Quiet Before the Bell")
+parser.add_argument("--seed", type=int, default=None, help="session seed (default: random per run)")
+parser.add_argument("--record", metavar="FILE", default=None, help="neem input per frame op (+ seed)")
+parser.add_argument("--replay", metavar="FILE", default=None, help="speel een opname af (seed uit de opname, geen frame cap)")
+parser.add_argument("--trace", metavar="FILE", default=None, help="schrijf een Chrome trace (Perfetto) van de loop fases")
+parser.add_argument("--dirty", action="store_true", help="dirty-rect rendering: alleen gewijzigde regio's hertekenen/pushen")
+parser.add_argument("--bundle", metavar="FILE", default=None, help="laad assets uit een bundle (python bundle.py build)")
+args = parser.parse_args()
+
+if args.bundle:
+    use_bundle(args.bundle)
+
+replay = InputReplay(args.replay) if args.replay else None
+if replay is not None:
+    args.seed = replay.seed
 
 pygame.init()
 
@@ -22,14 +48,10 @@ pygame.init()
 # BACKGROUND MUSIC
 # ----------------------------------
 pygame.mixer.init()
-pygame.mixer.music.load("assets/Sounds/bg_music.mp3")
+load_music("assets/Sounds/bg_music.mp3")
 pygame.mixer.music.set_volume(0.35)
 pygame.mixer.music.play(-1)
 
-# SFX
-school_bell = pygame.mixer.Sound("assets/Sounds/school_bell.mp3")
-school_bell.set_volume(0.7)
-
 # ----------------------------------
 # FONTS MANAGEMENT
 # ----------------------------------
@@ -38,6 +60,21 @@ font_big = pygame.font.SysFont(None, 96)
 font_small = pygame.font.SysFont(None, 24)
 
 screen = pygame.display.set_mode((1280, 720))
+
+# ----------------------------------
+# STARTUP LOADER (alle assets parallel decoderen, met laadbalk)
+# ----------------------------------
+# gestreamde muziek en gebakken sheets (bake.py) hoeven niet gedecodeerd
+loader = StartupLoader(scan_assets("assets", skip=("assets/Sounds/bg_music.mp3", *baked_sheets(config))))
+if not loader.run(screen, font):
+    pygame.quit()
+    raise SystemExit(0)
+for failed_path, err in loader.failed:
+    print(f"[loader] {failed_path}: {err}")
+
+# SFX
+school_bell = load_sound("assets/Sounds/school_bell.mp3", volume=0.7)
+
 scene_cache = {}
 main_screen = MainScreen(screen)
 state = "MAIN"
@@ -54,7 +91,6 @@ current_scene = None
 statui = StatBarUI()
 menu_ui = MenuUI(screen)
 inventory_ui = InventoryUI(screen)
-loot_sys = LootSystem()
 dialogue_ui = DialogueUI(screen)
 settings_menu = SettingsMenu(screen)
 profile_menu = ProfileMenu(screen)
@@ -62,17 +98,53 @@ profile_menu = ProfileMenu(screen)
 # ----------------------------------
 # SYSTEM klaarzetten
 # ----------------------------------
-spawner = EnemySpawner(
-    pool=config.ENEMY_POOL,
-    cfg_module=config,
-    spawn_y=680,
-    interval_min=1.2,
-    interval_max=2.5,
-    max_enemies=6,
-)
-
-wave_sys = WaveSystem(waves=config.WAVES, break_time=4.0)
-wave_sys.start()
+# gameplay (wave/player/spawner/enemies/projectiles/pickups/loot) zit in GameSession
+session = GameSession(world_width=WORLD_WIDTH, view_width=screen.get_width(), ground_y=680, seed=args.seed,
+                      interpolate=True)
+wave_sys = session.wave_sys
+
+# gameplay op een vaste 120 Hz stap, los van de frame rate (zie timestep.py)
+timestep = FixedTimestep()
+
+# sheets + scene van de volgende wave laden tijdens de BREAK (zie prefetch.py)
+prefetcher = AssetPrefetcher(config.WAVES, config, screen.get_size())
+
+# frame-time per fase (F3 = overlay)
+profiler = FrameProfiler()
+session.profiler = profiler
+
+tracer = None
+if args.trace:
+    from entities.enemies.enemy_base import EnemyBase
+    from entities.enemies.registry import ENEMY_REGISTRY
+    from pickups import BasePickup, CoinPickup, ItemPickup
+    from pickup_field import PickupField
+    from animation import Animator
+    from ui.dialogue_ui import DialogueUI
+    from ui.ui_statbar import StatBarUI
+
+    tracer = TraceWriter(args.trace)
+    profiler.tracer = tracer
+
+    tracer.instrument(EnemyBase, "update")
+    for enemy_cls in ENEMY_REGISTRY.values():
+        tracer.instrument(enemy_cls, "update")   # alleen classes met een eigen update()
+    # pickups: het pad dat de session echt gebruikt (PickupField met numpy, anders per pickup)
+    if session.pickup_field is not None:
+        tracer.instrument(PickupField, "update")
+        tracer.instrument(PickupField, "compact")
+    else:
+        tracer.instrument(BasePickup, "update")
+    for pickup_cls in (BasePickup, CoinPickup, ItemPickup):
+        tracer.instrument(pickup_cls, "collect")   # alleen classes met een eigen collect()
+    tracer.instrument(Animator, "update")
+    tracer.instrument(DialogueUI, "draw")
+    tracer.instrument(StatBarUI, "draw")
+
+
+def log_session():
+    # seed altijd loggen: zelfde seed (+ zelfde input) = zelfde run
+    print(f"[session] seed={session.seed}")
 
 
 def start_intro():
@@ -82,29 +154,32 @@ def start_intro():
 
 
 def reset_game():
-    spawner.reset()
-    wave_sys.start()
-    player = Player(640, 680, config.PLAYER)
-    projectiles = []
-    enemies = []
-    pickups = []
-    return player, projectiles, enemies, pickups
+    # volgende seed afleiden i.p.v. random: restarts blijven zo reproduceerbaar
+    session.reset(seed=session.seed + 1)
+    timestep.reset()
+    log_session()
+    return session.player
 
 
-player, projectiles, enemies, pickups = reset_game()
+player = session.player
+log_session()
 
+recorder = InputRecorder(args.record, session.seed) if args.record else None
 
-def draw_scene_background(path: str):
-    if not path:
-        screen.fill((20, 20, 20))
-        return
 
-    if path not in scene_cache:
-        img = pygame.image.load(path).convert()
-        img = pygame.transform.scale(img, screen.get_size())
-        scene_cache[path] = img
+def get_scene_surface(path: str) -> pygame.Surface:
+    if path:
+        return load_scene(path, screen.get_size())  # gedeelde cache (ook door de prefetcher gevuld)
+    if None not in scene_cache:
+        img = pygame.Surface(screen.get_size()).convert()
+        img.fill((20, 20, 20))
+        scene_cache[None] = img
+    return scene_cache[None]
 
-    screen.blit(scene_cache[path], (0, 0))
+
+def draw_scene_background(path: str):
+    # getegeld + meegescrold met de camera
+    blit_scrolled(screen, get_scene_surface(path), session.view_x)
 
 
 def set_scene_for_wave(wave_nr: int):
@@ -124,23 +199,58 @@ fade_speed = 320  # alpha per second
 fade_surface = pygame.Surface(screen.get_size())
 fade_surface.fill((0, 0, 0))
 
+# ----------------------------------
+# DIRTY-RECT RENDERING (optioneel)
+# ----------------------------------
+renderer = DirtyRectRenderer(screen) if args.dirty else None
+overlay_was_visible = False
+
+# HUD tekst + entities worden per layer gebatcht (Surface.blits); UI tekent daarna direct
+render_queue = RenderQueue(screen, MAIN_LAYERS, track_rects=renderer is not None)
+hud_layer = render_queue.layer("hud")
+hud_top_layer = render_queue.layer("hud_top")
+
 # ----------------------------------
 # Actual running
 # ----------------------------------
 running = True
 while running:
-    dt = clock.tick(60) / 1000.0
+    # replay: zo snel mogelijk, dt komt uit de opname
+    dt = clock.tick(0 if replay else 60) / 1000.0
+    profiler.begin_frame()
+    events = pygame.event.get()
     keys = pygame.key.get_pressed()
+    mouse_buttons = pygame.mouse.get_pressed()
+    mouse_pos = pygame.mouse.get_pos()
+
+    # --------------------------------------------------
+    # INPUT: RECORD / REPLAY
+    # --------------------------------------------------
+    if replay is not None:
+        if any(e.type == pygame.QUIT for e in events):
+            break
+        frame = replay.next_frame()
+        if frame is None:
+            print(f"[replay] done: {replay.frames} frames")
+            break
+        dt, keys, mouse_buttons, mouse_pos, events = frame
+    elif recorder is not None:
+        recorder.write_frame(dt, keys, mouse_buttons, mouse_pos, events)
+
     ui_used_click_this_frame = False
 
     # --------------------------------------------------
     # EVENTS
     # --------------------------------------------------
-    for event in pygame.event.get():
+    for event in events:
         if event.type == pygame.QUIT:
             running = False
             break
 
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            profiler.toggle()
+            continue
+
         # --- MAIN SCREEN ---
         if state == "MAIN":
             action = main_screen.handle_event(event)
@@ -162,7 +272,7 @@ while running:
         # --- IN-GAME EVENTS (PLAY) ---
         if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
             if player.dead:
-                player, projectiles, enemies, pickups = reset_game()
+                player = reset_game()
 
         used_ui, clicked = menu_ui.handle_event(event)
         if used_ui:
@@ -186,7 +296,7 @@ while running:
         if action == "resume":
             settings_menu.visible = False
         elif action == "restart":
-            player, projectiles, enemies, pickups = reset_game()
+            player = reset_game()
             settings_menu.visible = False
         elif action == "menu":
             state = "MAIN"
@@ -200,6 +310,10 @@ while running:
         elif act == "up_dmg":
             player.upgrade_damage()
 
+    # andere states tekenen full screen: PLAY begint daarna met een volledige frame
+    if renderer is not None and state != "PLAY":
+        renderer.invalidate()
+
     # --------------------------------------------------
     # STATE: MAIN
     # --------------------------------------------------
@@ -229,7 +343,7 @@ while running:
             state = "PLAY"
 
         draw_scene_background(current_scene)
-        player.draw(screen)
+        session.draw_entities(screen)
 
         statui.draw(screen)
         menu_ui.draw()
@@ -250,7 +364,6 @@ while running:
     # --------------------------------------------------
     # PLAY: UI BLOCK INPUT
     # --------------------------------------------------
-    mouse_pos = pygame.mouse.get_pos()
     ui_block_input = False
 
     if inventory_ui.visible and any(r.collidepoint(mouse_pos) for r in inventory_ui.rects):
@@ -271,68 +384,17 @@ while running:
     # --------------------------------------------------
     # ✅ PLAY: GAMEPLAY UPDATE (alleen als NIET paused)
     # --------------------------------------------------
+    profiler.lap("events")
     if not paused:
-        # wave
-        wave_sys.update(dt, spawner, enemies)
-
-        # player
-        player.update(keys, dt, projectiles, config.PROJECTILES, ui_block_input)
-
-        # keep player inside screen
-        SW, SH = screen.get_size()
-        MARGIN_X = 5
-        if player.rect.centerx < MARGIN_X:
-            player.rect.centerx = MARGIN_X
-        if player.rect.centerx > SW - MARGIN_X:
-            player.rect.centerx = SW - MARGIN_X
-
-        # sync eventuele float-pos variabelen (als je Player die gebruikt)
-        if hasattr(player, "pos"):
-            try:
-                player.pos.x = float(player.rect.centerx)
-            except Exception:
-                pass
-        if hasattr(player, "x"):
-            player.x = float(player.rect.centerx)
-
-        # spawn
-        if (not player.dead) and wave_sys.can_spawn():
-            before = len(enemies)
-            spawner.update(dt, player, enemies, world_width=WORLD_WIDTH)
-            spawned_now = len(enemies) - before
-            if spawned_now > 0:
-                wave_sys.on_spawned(spawned_now)
-
-        # enemies / projectiles
-        for e in enemies:
-            e.update(dt, player)
-        for p in projectiles:
-            p.update(dt)
-
-        # pickups
-        for c in pickups:
-            was_collected = getattr(c, "collected", False)
-            c.update(dt, player)
-            if (not was_collected) and getattr(c, "collected", False):
-                player.coins = getattr(player, "coins", 0) + getattr(c, "value", 1)
-
-        # collisions
-        for p in projectiles:
-            for e in enemies:
-                if p.rect.colliderect(e.rect) and not getattr(e, "dead", False):
-                    dmg = config.DAMAGE["book"] + getattr(player, "damage_bonus", 0)
-                    e.take_damage(dmg)
-                    p.age = p.lifetime
-
-        # loot
-        for e in enemies:
-            if getattr(e, "dead", False) and not getattr(e, "_loot_dropped", False):
-                loot_sys.on_enemy_death(e, pickups)
-
-        # cleanup
-        projectiles = [p for p in projectiles if not p.is_dead()]
-        enemies = [e for e in enemies if not getattr(e, "remove", False)]
-        pickups = [c for c in pickups if not getattr(c, "remove", False) and not c.is_dead()]
+        inp = InputState(keys, mouse_buttons, mouse_pos, ui_block_input)
+        for _ in range(timestep.advance(dt)):
+            session.step(timestep.dt, inp)
+        session.render_alpha = timestep.alpha
+
+    if wave_sys.state == "BREAK":
+        prefetcher.request_wave(wave_sys.wave + 1)
+    prefetcher.update()
+    profiler.lap("prefetch")
 
     # --------------------------------------------------
     # UI UPDATE (mag ook tijdens pause, toont HP/coins etc.)
@@ -347,6 +409,7 @@ while running:
         mana_exhausted=player.mana_exhausted,
     )
     statui.update(dt)
+    profiler.lap("ui update")
 
     # --------------------------------------------------
     # DRAW
@@ -354,46 +417,80 @@ while running:
     current_wave_cfg = config.WAVES.get(wave_sys.wave, {})
     scene = current_wave_cfg.get("scene") or current_scene
     current_scene = scene
-    draw_scene_background(scene)
 
-    wave_text = font.render(f"WAVE {wave_sys.wave} - {wave_sys.state}", True, (255, 255, 255))
-    screen.blit(wave_text, (100, 10))
+    if renderer is not None:
+        # full-screen overlays (ook de frame na het sluiten) => volledige redraw
+        overlay_visible = settings_menu.visible or profile_menu.visible
+        if overlay_visible or overlay_was_visible:
+            renderer.invalidate()
+        overlay_was_visible = overlay_visible
+        renderer.begin(get_scene_surface(scene), session.view_x)  # camera bewogen => full redraw
+    else:
+        draw_scene_background(scene)
+    profiler.lap("bg draw")
 
-    remaining = max(0, (wave_sys.spawn_limit - wave_sys.spawned) + len(enemies))
-    left_text = font_small.render(f"ENEMIES LEFT: {remaining}", True, (255, 255, 255))
-    screen.blit(left_text, (100, 80))
+    drawn = []  # getekende rects deze frame (dirty-rect rendering)
+
+    wave_text = render_text(font, f"WAVE {wave_sys.wave} - {wave_sys.state}", (255, 255, 255))
+    drawn.append(hud_layer.blit(wave_text, (100, 10)))
+
+    remaining = max(0, (wave_sys.spawn_limit - wave_sys.spawned) + len(session.enemies))
+    left_text = render_text(font_small, f"ENEMIES LEFT: {remaining}", (255, 255, 255))
+    drawn.append(hud_layer.blit(left_text, (100, 80)))
 
     if wave_sys.toast_text:
-        toast = font_big.render(wave_sys.toast_text, True, (255, 255, 255))
-        toast = toast.convert_alpha()
+        # gecachte (al convert_alpha'de) surface; alpha wordt elke frame opnieuw gezet
+        toast = render_text(font_big, wave_sys.toast_text, (255, 255, 255))
         toast.set_alpha(wave_sys.get_toast_alpha())
         rect = toast.get_rect(center=(1280 // 2, 120))
-        screen.blit(toast, rect)
+        drawn.append(hud_layer.blit(toast, rect))
+    profiler.lap("ui draw")
 
-    player.draw(screen)
+    drawn.extend(session.draw_entities(render_queue))
 
-    for e in enemies:
-        e.draw(screen)
-    for p in projectiles:
-        p.draw(screen)
-    for c in pickups:
-        c.draw(screen)
+    coin_text = render_text(font_small, f"COINS: {getattr(player, 'coins', 0)}", (255, 255, 0))
+    drawn.append(hud_top_layer.blit(coin_text, (100, 105)))
 
-    coin_text = font_small.render(f"COINS: {getattr(player, 'coins', 0)}", True, (255, 255, 0))
-    screen.blit(coin_text, (100, 105))
+    # volgorde: hud -> player -> enemies -> projectiles -> pickups -> hud_top
+    render_queue.flush()
+    profiler.lap("entity draw")
 
     # UI boven alles
-    statui.draw(screen)
-    menu_ui.draw()
-    inventory_ui.draw(player, config)
+    drawn.append(statui.draw(screen))
+    drawn.append(menu_ui.draw())
+    drawn.append(inventory_ui.draw(player, config))
     settings_menu.draw()
     profile_menu.draw(player,config)
 
     if player.dead:
-        text = font_big.render("YOU DIED", True, (255, 255, 255))
+        text = render_text(font_big, "YOU DIED", (255, 255, 255))
         rect = text.get_rect(center=(1280 // 2, 120))
-        screen.blit(text, rect)
+        drawn.append(screen.blit(text, rect))
+
+    profiler.set_count("enemies", len(session.enemies))
+    profiler.set_count("projectiles", len(session.projectiles))
+    profiler.set_count("pickups", len(session.pickups))
+    profiler.set_count("drawn", session.drawn_count)
+    profiler.set_count("sim steps", timestep.steps)
+    profiler.set_count("prefetch", prefetcher.pending)
+    drawn.append(profiler.draw(screen, font_small))
+    profiler.lap("ui draw")
+
+    if renderer is not None:
+        renderer.add(drawn)
+        renderer.present()
+    else:
+        pygame.display.flip()
+    profiler.lap("flip")
+    profiler.end_frame()
+
+if recorder is not None:
+    recorder.close()
+    print(f"[record] {recorder.frames} frames -> {recorder.path}")
 
-    pygame.display.flip()
+if tracer is not None:
+    tracer.close()
+    print(f"[trace] {tracer.events} events -> {tracer.path}")
 
+prefetcher.close()
 pygame.quit()
\ No newline at end of file
@@ -0,0 +1,220 @@
+# pickup_field.py
+"""
+Struct-of-arrays backend voor pickups (optioneel, vereist numpy).
+
+Alle live pickups staan in NumPy arrays (positie, velocity, bob timer, age,
+flags) en worden per frame in 1 gevectoriseerde stap geupdate. De pickup
+objecten zelf blijven bestaan voor draw() en collect()/apply().
+"""
+try:
+    import numpy as np
+except ImportError:  # numpy is optioneel -> main valt terug op BasePickup.update
+    np = None
+
+from pickups import AIR_DRAG
+
+
+class PickupField:
+    _FLOAT_FIELDS = (
+        "left", "top", "w", "h",
+        "vx", "vy", "gravity",
+        "bob", "base_y",
+        "age", "lifetime",
+        "magnet_speed", "magnet_r2", "pickup_r2",
+        "ground_y",
+    )
+    _INT_FIELDS = ("rect_x", "rect_y")  # laatst teruggeschreven rect.topleft
+    _BOOL_FIELDS = ("on_ground", "magnet", "collected")
+
+    def __init__(self, capacity: int = 256):
+        if np is None:
+            raise RuntimeError("PickupField requires numpy")
+
+        self.capacity = max(1, int(capacity))
+        self.count = 0
+        self.items: list = []  # gebonden pickups-lijst (zelfde volgorde als arrays)
+
+        for name in self._FLOAT_FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.float64))
+        for name in self._INT_FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.int64))
+        for name in self._BOOL_FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=bool))
+
+    @staticmethod
+    def available() -> bool:
+        return np is not None
+
+    # -------------------------
+    # STORAGE
+    # -------------------------
+    def bind(self, pickups: list):
+        """Koppel aan de (nieuwe) pickups-lijst van de game, bv. na reset."""
+        self.items = pickups
+        self.count = 0
+        self._absorb_new()
+
+    def _grow(self, needed: int):
+        new_cap = self.capacity
+        while new_cap < needed:
+            new_cap *= 2
+        for name in self._FLOAT_FIELDS + self._INT_FIELDS + self._BOOL_FIELDS:
+            old = getattr(self, name)
+            arr = np.zeros(new_cap, dtype=old.dtype)
+            arr[: self.count] = old[: self.count]
+            setattr(self, name, arr)
+        self.capacity = new_cap
+
+    def _absorb_new(self):
+        """Pickups die sinds vorige frame aan items zijn toegevoegd in de arrays zetten."""
+        n_items = len(self.items)
+        if n_items <= self.count:
+            return
+        if n_items > self.capacity:
+            self._grow(n_items)
+
+        for i in range(self.count, n_items):
+            p = self.items[i]
+            r = p.rect
+            self.left[i] = self.rect_x[i] = r.x
+            self.top[i] = self.rect_y[i] = r.y
+            self.w[i] = r.w
+            self.h[i] = r.h
+            self.vx[i] = p.vx
+            self.vy[i] = p.vy
+            self.gravity[i] = p.gravity
+            self.bob[i] = p.bob_timer
+            self.base_y[i] = p.base_y
+            self.age[i] = p.age
+            self.lifetime[i] = p.lifetime
+            self.magnet_speed[i] = p.magnet_speed
+            self.magnet_r2[i] = p.magnet_radius * p.magnet_radius
+            self.pickup_r2[i] = p.pickup_radius * p.pickup_radius
+            self.ground_y[i] = p.ground_y
+            self.on_ground[i] = p.on_ground
+            self.magnet[i] = p.magnet_active
+            self.collected[i] = p.collected
+
+        self.count = n_items
+
+    # -------------------------
+    # UPDATE (zelfde regels als BasePickup.update, maar gevectoriseerd)
+    # -------------------------
+    def update(self, dt: float, player) -> list:
+        """Update alle pickups; roept collect() aan en geeft de gecollecte pickups terug."""
+        self._absorb_new()
+        n = self.count
+        if n == 0:
+            return []
+
+        left = self.left[:n]
+        top = self.top[:n]
+        w = self.w[:n]
+        h = self.h[:n]
+        vx = self.vx[:n]
+        vy = self.vy[:n]
+        on_ground = self.on_ground[:n]
+        magnet = self.magnet[:n]
+        collected = self.collected[:n]
+
+        live = ~collected
+        self.age[:n][live] += dt
+
+        px, py = player.rect.midbottom
+        dx = px - (left + w * 0.5)
+        dy = py - (top + h * 0.5)
+        dist2 = dx * dx + dy * dy
+
+        # magnet trigger
+        magnet |= live & (dist2 <= self.magnet_r2[:n])
+
+        # dichtbij genoeg -> collect
+        collect_now = magnet & live & (dist2 <= self.pickup_r2[:n])
+
+        # magnet motion
+        pulling = magnet & live & ~collect_now
+        if pulling.any():
+            dist = np.sqrt(dist2[pulling])
+            step = self.magnet_speed[:n][pulling] * dt
+            snap = dist <= step
+            safe = np.where(snap, 1.0, dist)
+            move_x = np.where(snap, dx[pulling], dx[pulling] / safe * step)
+            move_y = np.where(snap, dy[pulling], dy[pulling] / safe * step)
+            left[pulling] += move_x
+            top[pulling] += move_y
+
+        # drop physics (niet gemagnetiseerd + nog in de lucht)
+        free = live & ~magnet
+        air = free & ~on_ground
+        if air.any():
+            vy[air] += self.gravity[:n][air] * dt
+            left[air] += vx[air] * dt
+            top[air] += vy[air] * dt
+            vx[air] *= AIR_DRAG ** (dt * 60.0)  # per 1/60 s, los van de step rate
+
+            ground_y = self.ground_y[:n]
+            hit = air & (top + h >= ground_y)
+            if hit.any():
+                top[hit] = ground_y[hit] - h[hit]
+
+                # bounce
+                vy[hit] *= -0.55
+                vx[hit] *= 0.6
+
+                # settle
+                settle = hit & (np.abs(vy) < 30)
+                vy[settle] = 0.0
+                vx[settle] = 0.0
+                on_ground[settle] = True
+                self.base_y[:n][settle] = top[settle]
+
+        # bobbing (alleen als stil)
+        bobbing = free & on_ground
+        if bobbing.any():
+            bob = self.bob[:n]
+            bob[bobbing] += dt * 3.0
+            top[bobbing] = self.base_y[:n][bobbing] + np.trunc(4.0 * np.sin(bob[bobbing]))
+
+        # rects terugschrijven voor draw() (alleen waar de int-positie veranderde)
+        items = self.items
+        ix = left.astype(np.int64)
+        iy = top.astype(np.int64)
+        moved = live & ((ix != self.rect_x[:n]) | (iy != self.rect_y[:n]))
+        if moved.any():
+            self.rect_x[:n] = ix
+            self.rect_y[:n] = iy
+            for i, x, y in zip(np.flatnonzero(moved).tolist(), ix[moved].tolist(), iy[moved].tolist()):
+                items[i].rect.topleft = (x, y)
+
+        # collect events (sound + apply via de pickup zelf)
+        out = []
+        for i in np.flatnonzero(collect_now).tolist():
+            p = items[i]
+            p.collect(player)
+            collected[i] = True
+            out.append(p)
+        return out
+
+    # -------------------------
+    # CLEANUP
+    # -------------------------
+    def compact(self):
+        """Verwijder gecollecte/verlopen pickups in-place uit de lijst en de arrays."""
+        n = self.count
+        if n == 0:
+            return
+
+        items = self.items
+        dead = self.collected[:n] | (self.age[:n] >= self.lifetime[:n])
+        if not dead.any():
+            return
+
+        keep = np.flatnonzero(~dead)
+        k = len(keep)
+        for name in self._FLOAT_FIELDS + self._INT_FIELDS + self._BOOL_FIELDS:
+            arr = getattr(self, name)
+            arr[:k] = arr[:n][keep]
+
+        # pickups die na update() zijn toegevoegd (loot) blijven achteraan staan
+        items[:] = [items[i] for i in keep.tolist()] + items[n:]
+        self.count = k
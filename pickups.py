@@ -2,7 +2,7 @@
 import random
 import math
 import pygame
-from assets import load_image
+from assets import load_image, load_sound
 
 
 def _scale_image(img: pygame.Surface, scale: float) -> pygame.Surface:
@@ -17,15 +17,20 @@ def _scale_image(img: pygame.Surface, scale: float) -> pygame.Surface:
 # ==========================================================
 # COIN PICKUP SOUND
 # ==========================================================
+# lazy via de gedeelde sound cache (pas bij de eerste coin decoderen)
 pygame.mixer.init()
 
-COIN_SOUND = pygame.mixer.Sound("assets/Sounds/coins.mp3")
-COIN_SOUND.set_volume(0.6)
+COIN_SOUND = "assets/Sounds/coins.mp3"
 
 
 # ==========================================================
 # BASE PICKUP (magnet + drop physics + bobbing)
 # ==========================================================
+# vx demping in de lucht per 1/60 s (de oorspronkelijke frame stap): per step
+# AIR_DRAG ** (dt * 60), dus bij 120 Hz even snel afgeremd als vroeger bij 60 Hz
+AIR_DRAG = 0.98
+
+
 class BasePickup:
     def __init__(
         self,
@@ -39,9 +44,11 @@ class BasePickup:
         magnet_speed: float = 900.0,
         magnet_radius: int = 140,
         pickup_radius: int = 22,
+        rng=None,
     ):
         self.image = _scale_image(image, scale)  # ✅ schaal hier
         self.rect = self.image.get_rect(center=(int(x), int(y)))
+        self.pos = pygame.Vector2(self.rect.topleft)  # sub-pixel positie (rect = int(pos))
 
         # state
         self.collected = False
@@ -55,15 +62,18 @@ class BasePickup:
         self.pickup_radius = int(pickup_radius * float(scale))
         self.magnet_active = False
 
+        # stream "pickups" (random_streams.py)
+        rng = rng if rng is not None else random
+
         # physics
         self.ground_y = int(ground_y)
-        self.vx = random.uniform(-60, 60)
-        self.vy = random.uniform(-220, -120)
+        self.vx = rng.uniform(-60, 60)
+        self.vy = rng.uniform(-220, -120)
         self.gravity = 1200.0
         self.on_ground = False
 
         # bobbing
-        self.bob_timer = random.uniform(0, math.tau)
+        self.bob_timer = rng.uniform(0, math.tau)
         self.base_y = self.rect.y
 
         # lifetime
@@ -116,20 +126,24 @@ class BasePickup:
 
             if dist <= step:
                 self.rect.center = (px, py)
+                self.pos.update(self.rect.topleft)
             else:
-                self.rect.centerx += int(dx / dist * step)
-                self.rect.centery += int(dy / dist * step)
+                self.pos.x += dx / dist * step
+                self.pos.y += dy / dist * step
+                self.rect.topleft = (int(self.pos.x), int(self.pos.y))
             return
 
         # drop physics
         if not self.on_ground:
             self.vy += self.gravity * dt
-            self.rect.x += int(self.vx * dt)
-            self.rect.y += int(self.vy * dt)
-            self.vx *= 0.98
+            self.pos.x += self.vx * dt
+            self.pos.y += self.vy * dt
+            self.vx *= AIR_DRAG ** (dt * 60.0)
+            self.rect.topleft = (int(self.pos.x), int(self.pos.y))
 
             if self.rect.bottom >= self.ground_y:
                 self.rect.bottom = self.ground_y
+                self.pos.y = self.rect.y
 
                 # bounce
                 self.vy *= -0.55
@@ -146,13 +160,15 @@ class BasePickup:
         if self.on_ground:
             self.bob_timer += dt * 3.0
             self.rect.y = self.base_y + int(4 * math.sin(self.bob_timer))
+            self.pos.y = self.rect.y
 
     def is_dead(self):
         return self.remove or self.age >= self.lifetime
 
     def draw(self, screen: pygame.Surface):
         if not self.collected:
-            screen.blit(self.image, self.rect)
+            return screen.blit(self.image, self.rect)
+        return None
 
 
 # ==========================================================
@@ -163,7 +179,7 @@ class CoinPickup(BasePickup):
     COIN_MED = None
     COIN_BIG = None
 
-    def __init__(self, x: float, y: float, value: int = 1):
+    def __init__(self, x: float, y: float, value: int = 1, rng=None):
         self.value = int(value)
 
         # images cached
@@ -188,7 +204,7 @@ class CoinPickup(BasePickup):
         else:
             img = CoinPickup.COIN_SMALL
 
-        super().__init__(x, y, img)  # coins al geschaald via cached images
+        super().__init__(x, y, img, rng=rng)  # coins al geschaald via cached images
 
     def apply(self, player):
         player.coins = getattr(player, "coins", 0) + self.value
@@ -197,7 +213,7 @@ class CoinPickup(BasePickup):
         if self.collected:
             return
         
-        COIN_SOUND.play()
+        load_sound(COIN_SOUND, volume=0.6).play()
 
         self.collected = True
         self.apply(player)
@@ -208,16 +224,16 @@ class CoinPickup(BasePickup):
 # ITEM PICKUP (Apple, Potion, etc.)
 # ==========================================================
 class ItemPickup(BasePickup):
-    def __init__(self, x: float, y: float, cfg: dict):
+    def __init__(self, x: float, y: float, cfg: dict, rng=None):
         self.item_id = cfg["id"]          # bv "APPLE"
         self.amount = int(cfg.get("amount", 1))
 
-        img = pygame.image.load(cfg["image"]).convert_alpha()
+        img = load_image(cfg["image"], alpha=True)
 
         # ✅ groter maken (tweakbaar per item via config: drop_scale)
         drop_scale = float(cfg.get("drop_scale", 2.2))
 
-        super().__init__(x, y, img, scale=drop_scale)
+        super().__init__(x, y, img, scale=drop_scale, rng=rng)
 
     def apply(self, player):
         player.add_item(self.item_id, self.amount)
\ No newline at end of file
@@ -0,0 +1,140 @@
+# prefetch.py
+"""
+Assets voor de volgende wave vooraf laden (tijdens de BREAK).
+
+config.WAVES zegt welke enemy types (pool) en welke scene een wave nodig
+heeft. Het decoderen van de PNG's (pygame.image.load) gebeurt op een worker
+thread; convert_alpha/convert + slicen/schalen/flippen moet op de main thread
+en gebeurt in update() per stukje (sheet convert, 1 frame, 1 scene) binnen een
+tijdsbudget per frame.
+Daarna zit alles in de gewone caches (assets / animation), dus de eerste
+spawn van een nieuw enemy type laadt niks meer.
+
+    prefetcher.request_wave(wave_sys.wave + 1)   # idempotent
+    prefetcher.update()                          # 1x per frame
+"""
+import threading
+import time
+from collections import deque
+from queue import SimpleQueue
+
+import pygame
+
+import assets
+from animation import has_frame_sequence, iter_frame_sequence
+from bake import is_baked
+
+
+class AssetPrefetcher:
+    def __init__(self, waves: dict, cfg_module, scene_size, budget_ms: float = 2.0):
+        self.waves = waves
+        self.cfg = cfg_module
+        self.scene_size = tuple(scene_size)
+        self.budget = float(budget_ms) / 1000.0
+
+        self._requested: set[int] = set()
+        self._submitted: set[tuple] = set()
+        self._jobs: SimpleQueue = SimpleQueue()   # -> worker: te decoderen
+        self._ready: deque = deque()              # <- worker: af te maken op de main thread
+        self._active = None                       # frame sequence generator die half af is
+        self._thread: threading.Thread | None = None
+        self._in_flight = 0
+
+        # stats
+        self.decoded = 0
+        self.finished = 0
+
+    # -------------------------
+    # REQUEST
+    # -------------------------
+    def _wave_jobs(self, wave_nr: int):
+        wcfg = self.waves[wave_nr]
+        for entry in wcfg.get("pool", ()):
+            ecfg = getattr(self.cfg, entry["cfg_key"])
+            scale = int(ecfg.get("scale", 2))  # zelfde default als EnemyBase
+            for a in ecfg["anims"].values():
+                # gebakken sequences laden zonder decode/transform: niks te prefetchen
+                if not (has_frame_sequence(a["sheet"], a["frames"], scale) or is_baked(a["sheet"], a["frames"], scale)):
+                    yield ("frames", a["sheet"], int(a["frames"]), scale)
+
+        scene = wcfg.get("scene")
+        if scene and not assets.has_scene(scene, self.scene_size):
+            yield ("scene", scene, self.scene_size)
+
+    def request_wave(self, wave_nr: int):
+        """Start het laden van alles wat wave_nr nodig heeft (1x per wave)."""
+        if wave_nr in self._requested or wave_nr not in self.waves:
+            return
+        self._requested.add(wave_nr)
+
+        for job in self._wave_jobs(wave_nr):
+            if job in self._submitted:
+                continue
+            self._submitted.add(job)
+            self._in_flight += 1
+            self._jobs.put(job)
+
+        if self._in_flight and self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="prefetch", daemon=True)
+            self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """Jobs die nog gedecodeerd of afgemaakt moeten worden."""
+        return self._in_flight
+
+    # -------------------------
+    # WORKER THREAD (alleen decoderen)
+    # -------------------------
+    def _worker(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            path = job[1]
+            if not (assets.has_decoded(path) or (job[0] == "frames" and assets.has_image(path))):
+                try:
+                    assets.add_decoded(path, assets.decode_image(path))
+                    self.decoded += 1
+                except (pygame.error, OSError):
+                    pass  # de main thread laadt het dan gewoon zelf (en meldt de fout daar)
+            self._ready.append(job)
+
+    # -------------------------
+    # MAIN THREAD (convert + frames, binnen budget)
+    # -------------------------
+    def update(self, budget: float | None = None) -> int:
+        """Maak gedecodeerde assets af tot het budget (seconden) op is. Geeft het aantal terug."""
+        if self._active is None and not self._ready:
+            return 0
+
+        deadline = time.perf_counter() + (self.budget if budget is None else budget)
+        done = 0
+        while self._active is not None or self._ready:
+            if self._active is None:
+                job = self._ready.popleft()
+                if job[0] == "frames":
+                    _, path, frames, scale = job
+                    self._active = iter_frame_sequence(path, frames, scale)
+                else:
+                    _, path, size = job
+                    assets.load_scene(path, size)
+                    self._done()
+                    done += 1
+
+            if self._active is not None and next(self._active, StopIteration) is StopIteration:
+                self._active = None
+                self._done()
+                done += 1
+
+            if time.perf_counter() >= deadline:
+                break
+        return done
+
+    def _done(self):
+        self._in_flight -= 1
+        self.finished += 1
+
+    def close(self):
+        if self._thread is not None:
+            self._jobs.put(None)
@@ -0,0 +1,152 @@
+# profiler.py
+"""
+Frame-time profiler per fase van de game loop.
+
+    profiler.begin_frame()
+    ...events...
+    profiler.lap("events")      # tijd sinds vorige lap -> "events"
+    session.step(dt, inp)       # GameSession doet zelf laps (wave, player, ...)
+    ...
+    profiler.lap("flip")
+    profiler.end_frame()
+
+Per fase houdt hij een rolling window bij (avg / p95 / p99 in ms).
+F3 toggelt de overlay (draw()). Met een tracer (tracing.TraceWriter) wordt
+elke lap ook als begin/end event in de trace gezet.
+"""
+import time
+from collections import deque
+
+import pygame
+
+
+class NullProfiler:
+    """Default voor GameSession (headless, sweeps): doet niks."""
+
+    def lap(self, name: str):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class FrameProfiler:
+    def __init__(self, window: int = 240, refresh: float = 0.25):
+        self.window = int(window)
+        self.refresh = float(refresh)   # overlay tekst max 4x per seconde opnieuw renderen
+
+        self.samples: dict[str, deque] = {}   # fase -> ms per frame (insertion order = loop volgorde)
+        self._current: dict[str, float] = {}
+        self._mark = time.perf_counter()
+        self._frame_start = self._mark
+
+        self.counts: dict[str, int] = {}
+        self.visible = False
+        self.tracer = None
+
+        self._panel: pygame.Surface | None = None
+        self._next_refresh = 0.0
+
+    # -------------------------
+    # MEASURE
+    # -------------------------
+    def begin_frame(self):
+        self._current.clear()
+        self._mark = self._frame_start = time.perf_counter()
+
+    def lap(self, name: str):
+        now = time.perf_counter()
+        self._current[name] = self._current.get(name, 0.0) + (now - self._mark)
+        if self.tracer is not None:
+            self.tracer.span(name, self._mark, now)
+        self._mark = now
+
+    def end_frame(self):
+        now = time.perf_counter()
+        self._current["frame"] = now - self._frame_start
+        if self.tracer is not None:
+            self.tracer.complete("frame", self._frame_start, now)
+
+        for name, secs in self._current.items():
+            dq = self.samples.get(name)
+            if dq is None:
+                dq = self.samples[name] = deque(maxlen=self.window)
+            dq.append(secs * 1000.0)
+
+    def set_count(self, name: str, value: int):
+        self.counts[name] = int(value)
+
+    # -------------------------
+    # STATS
+    # -------------------------
+    @staticmethod
+    def _percentile(sorted_vals: list, q: float) -> float:
+        if not sorted_vals:
+            return 0.0
+        idx = min(len(sorted_vals) - 1, int(round(q * (len(sorted_vals) - 1))))
+        return sorted_vals[idx]
+
+    def stats(self) -> dict:
+        """fase -> (avg, p95, p99) in ms over het window."""
+        out = {}
+        for name, dq in self.samples.items():
+            vals = sorted(dq)
+            avg = sum(vals) / len(vals) if vals else 0.0
+            out[name] = (avg, self._percentile(vals, 0.95), self._percentile(vals, 0.99))
+        return out
+
+    # -------------------------
+    # OVERLAY
+    # -------------------------
+    def toggle(self):
+        self.visible = not self.visible
+        self._next_refresh = 0.0
+
+    def _render_panel(self, font: pygame.font.Font):
+        rows = [("phase", "avg", "p95", "p99")]
+        for name, (avg, p95, p99) in self.stats().items():
+            rows.append((name, f"{avg:.2f}", f"{p95:.2f}", f"{p99:.2f}"))
+
+        # per cel renderen: kolommen uitlijnen werkt dan ook met een niet-monospace font
+        color = (230, 230, 230)
+        cells = [[font.render(text, True, color) for text in row] for row in rows]
+        footer = None
+        if self.counts:
+            footer = font.render("  ".join(f"{k}={v}" for k, v in self.counts.items()), True, color)
+
+        pad, gap = 8, 14
+        line_h = font.get_linesize()
+        col_w = [max(row[c].get_width() for row in cells) for c in range(4)]
+
+        w = sum(col_w) + gap * 3 + pad * 2
+        if footer is not None:
+            w = max(w, footer.get_width() + pad * 2)
+        h = line_h * (len(cells) + (1 if footer is not None else 0)) + pad * 2
+
+        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        y = pad
+        for row in cells:
+            x = pad
+            for c, surf in enumerate(row):
+                # naam links, getallen rechts uitgelijnd
+                cx = x if c == 0 else x + col_w[c] - surf.get_width()
+                panel.blit(surf, (cx, y))
+                x += col_w[c] + gap
+            y += line_h
+        if footer is not None:
+            panel.blit(footer, (pad, y))
+
+        self._panel = panel
+
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font, pos=(12, 120)):
+        if not self.visible:
+            return None
+
+        now = time.perf_counter()
+        if now >= self._next_refresh:
+            self._render_panel(font)
+            self._next_refresh = now + self.refresh
+
+        return screen.blit(self._panel, pos)
@@ -1,5 +1,6 @@
 import pygame
-from animation import SpriteSheet, Animator
+from animation import Animator, load_frame_sequence
+from atlas import frame_size
 
 class BookProjectile:
     def __init__(self, x: float, y: float, direction: int, config: dict):
@@ -11,26 +12,28 @@ class BookProjectile:
         scale = config.get("scale", 2)
         fps = config.get("fps", 16)
 
-        sheet = SpriteSheet(config["sheet"])
-        frames = config["frames"]
-
-        sheet_w = sheet.sheet.get_width()
-        sheet_h = sheet.sheet.get_height()
-        frame_w = sheet_w // frames
-        frame_h = sheet_h
-
-        right = sheet.slice_row(row=0, frames=frames, frame_w=frame_w, frame_h=frame_h, scale=scale)
-        left  = [pygame.transform.flip(f, True, False) for f in right]
+        right, left = load_frame_sequence(config["sheet"], config["frames"], scale)
 
         animations = {"fly": {"right": right, "left": left, "loop": True}}
         self.anim = Animator(animations, default="fly", fps=fps)
 
         self.image = self.anim.get_image(direction == 1)
-        self.rect = self.image.get_rect(center=(x, y))
+        self.rect = pygame.Rect((0, 0), frame_size(self.image))
+        self.rect.center = (x, y)
 
         self.pos = pygame.Vector2(self.rect.center)
         self.vel = pygame.Vector2(self.speed * direction, 0)
 
+    def reset(self, x: float, y: float, direction: int):
+        """Hergebruik een (gepoolde) projectile alsof hij net gespawned is."""
+        self.direction = direction
+        self.age = 0.0
+        self.anim.play("fly", reset_if_same=True)
+
+        self.rect.center = (x, y)
+        self.pos.update(self.rect.center)
+        self.vel.update(self.speed * direction, 0)
+
     def update(self, dt: float):
         self.age += dt
         self.pos += self.vel * dt
@@ -39,7 +42,50 @@ class BookProjectile:
 
     def draw(self, screen: pygame.Surface):
         img = self.anim.get_image(self.direction == 1)
-        screen.blit(img, self.rect)
+        return screen.blit(img, self.rect)
 
     def is_dead(self) -> bool:
-        return self.age >= self.lifetime
\ No newline at end of file
+        return self.age >= self.lifetime
+
+
+class ProjectilePool:
+    """
+    Vaste voorraad BookProjectiles: acquire() geeft een gereset object terug,
+    release_dead() haalt dode projectiles uit de actieve lijst en legt ze terug.
+    """
+
+    def __init__(self, config: dict, prealloc: int = 16):
+        self.config = config
+        self._free: list[BookProjectile] = [
+            BookProjectile(0, 0, 1, config) for _ in range(int(prealloc))
+        ]
+
+    def acquire(self, x: float, y: float, direction: int) -> BookProjectile:
+        if self._free:
+            p = self._free.pop()
+            p.reset(x, y, direction)
+            return p
+        # pool leeg -> groeien (object komt later via release terug)
+        return BookProjectile(x, y, direction, self.config)
+
+    def release(self, p: BookProjectile):
+        self._free.append(p)
+
+    def release_all(self, projectiles: list):
+        """Alle projectiles uit de actieve lijst terug in de pool (reset / restart)."""
+        self._free.extend(projectiles)
+        projectiles.clear()
+
+    def release_dead(self, projectiles: list):
+        """In-place cleanup van de actieve lijst (geen nieuwe list per frame)."""
+        keep = 0
+        for p in projectiles:
+            if p.is_dead():
+                self._free.append(p)
+            else:
+                projectiles[keep] = p
+                keep += 1
+        del projectiles[keep:]
+
+    def free_count(self) -> int:
+        return len(self._free)
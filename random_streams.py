@@ -0,0 +1,28 @@
+# random_streams.py
+import random
+
+
+class RandomStreams:
+    """
+    1 session seed -> per subsystem een eigen random.Random.
+
+    Elke stream is geseed met "<seed>:<naam>", dus een subsystem dat meer of
+    minder random calls doet verschuift de andere streams niet.
+
+    Subsystems (spawner, loot, pickups, block) krijgen hun stream als `rng`
+    parameter; GameSession.reset deelt ze uit. rng=None valt terug op de
+    globale random module: werkt, maar is niet reproduceerbaar met een seed.
+    """
+
+    def __init__(self, seed: int | None = None):
+        if seed is None:
+            seed = random.SystemRandom().randrange(2**31)
+        self.seed = int(seed)
+        self._streams: dict[str, random.Random] = {}
+
+    def get(self, name: str) -> random.Random:
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = random.Random(f"{self.seed}:{name}")
+            self._streams[name] = rng
+        return rng
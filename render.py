@@ -0,0 +1,225 @@
+# render.py
+"""
+Rendering helpers: dirty-rectangle rendering en een gebatchte render queue.
+
+Dirty-rectangle rendering (optioneel, main.py --dirty).
+
+Per frame:
+    renderer.begin(background, scroll_x)   # vorige frame's rects herstellen uit de background
+    renderer.add(rect_of_list)   # alles wat deze frame getekend is
+    renderer.present()           # display.update(oud + nieuw) i.p.v. flip()
+
+Full redraw (volledige background + flip) bij: eerste frame, andere background,
+andere scroll_x (camera bewogen), invalidate() (bv. full-screen overlays of een andere state) of als de dirty
+oppervlakte toch al groter is dan full_ratio van het scherm.
+"""
+import pygame
+
+from atlas import region as _atlas_region
+
+
+def blit_scrolled(screen: pygame.Surface, background: pygame.Surface, scroll_x: int = 0):
+    """Background horizontaal getegeld, scroll_x pixels naar links geschoven (camera)."""
+    w = background.get_width()
+    x = -(int(scroll_x) % w)
+    right = screen.get_width()
+    while x < right:
+        screen.blit(background, (x, 0))
+        x += w
+
+
+class DirtyRectRenderer:
+    def __init__(self, screen: pygame.Surface, full_ratio: float = 0.6):
+        self.screen = screen
+        self.full_ratio = float(full_ratio)
+        self._screen_rect = screen.get_rect()
+        self._screen_area = self._screen_rect.w * self._screen_rect.h
+
+        self._background: pygame.Surface | None = None
+        self._scroll = 0
+        self._view: pygame.Surface | None = None   # background zoals in beeld (getegeld/gescrold)
+        self._prev: list[pygame.Rect] = []   # getekend vorige frame (moet hersteld worden)
+        self._cur: list[pygame.Rect] = []
+        self._full = True
+
+        # stats (profiler overlay / debugging)
+        self.full_frames = 0
+        self.dirty_frames = 0
+        self.last_rects = 0
+
+    def invalidate(self):
+        """Volgende frame volledig hertekenen."""
+        self._full = True
+
+    # -------------------------
+    # FRAME
+    # -------------------------
+    def begin(self, background: pygame.Surface, scroll_x: int = 0):
+        scroll_x = int(scroll_x)
+        if background is not self._background or scroll_x != self._scroll:
+            self._background = background
+            self._scroll = scroll_x
+            self._view = self._compose(background, scroll_x)
+            self._full = True
+
+        view = self._view
+        if self._full:
+            self.screen.blit(view, (0, 0))
+        else:
+            blit = self.screen.blit
+            for r in self._prev:
+                blit(view, r, r)
+
+    def _compose(self, background: pygame.Surface, scroll_x: int) -> pygame.Surface:
+        if scroll_x % background.get_width() == 0 and background.get_size() == self._screen_rect.size:
+            return background
+        # 1 scherm-grote buffer hergebruiken; alleen opnieuw vullen als de camera beweegt
+        view = self._view
+        if view is None or view is background or view.get_size() != self._screen_rect.size:
+            view = pygame.Surface(self._screen_rect.size).convert()
+        blit_scrolled(view, background, scroll_x)
+        return view
+
+    def add(self, drawn):
+        """Rect, lijst van rects of None (niks getekend)."""
+        if drawn is None:
+            return
+        if isinstance(drawn, pygame.Rect):
+            if drawn.w > 0 and drawn.h > 0:
+                self._cur.append(drawn)
+            return
+        for r in drawn:
+            if r is not None and r.w > 0 and r.h > 0:
+                self._cur.append(r)
+
+    def present(self):
+        cur = [r.clip(self._screen_rect) for r in self._cur]
+        cur = [r for r in cur if r.w > 0 and r.h > 0]
+
+        if not self._full:
+            dirty = self._prev + cur
+            area = sum(r.w * r.h for r in dirty)
+            if area > self._screen_area * self.full_ratio:
+                self._full = True
+
+        if self._full:
+            pygame.display.flip()
+            self.full_frames += 1
+            self.last_rects = 1
+        else:
+            pygame.display.update(dirty)
+            self.dirty_frames += 1
+            self.last_rects = len(dirty)
+
+        self._prev = cur
+        self._cur = []
+        self._full = False
+
+
+# ----------------------------------
+# RENDER QUEUE (gebatchte blits per layer)
+# ----------------------------------
+class _LayerTarget:
+    """
+    Staat in voor `screen` in draw(screen): blit() queuet i.p.v. direct te tekenen.
+    dest wordt verschoven met de layer offset (wereld -> scherm, zie camera.py);
+    sprites die daarna horizontaal volledig buiten beeld vallen worden meteen geskipt.
+    Atlas frames (atlas.py) gaan de queue in als page + source rect.
+    """
+
+    __slots__ = ("_append", "_clip", "_left", "_right", "_track", "dx", "dy")
+
+    def __init__(self, items: list, clip: pygame.Rect, track: bool):
+        self._append = items.append
+        self._clip = clip
+        self._left = clip.left
+        self._right = clip.right
+        self._track = track
+        self.dx = 0
+        self.dy = 0
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags: int = 0):
+        # dest als (x, y) kopieren: een Rect kan nog wijzigen voor flush()
+        x = dest[0] + self.dx
+        y = dest[1] + self.dy
+
+        # atlas frame: als (page, dest + trim offset, area) blitten
+        region = _atlas_region(source)
+        if region is not None:
+            page, page_area, ox, oy, _ = region
+            x += ox
+            y += oy
+            if area is None:
+                area = page_area
+            else:
+                area = pygame.Rect(area).move(page_area.topleft).clip(page_area)
+            source = page
+
+        if area is None:
+            w, h = source.get_size()
+        else:
+            area = pygame.Rect(area)
+            w, h = area.w, area.h
+
+        if x >= self._right or x + w <= self._left:
+            return pygame.Rect(x, y, 0, 0) if self._track else None
+
+        if area is None and not special_flags:
+            self._append((source, (x, y)))
+        else:
+            self._append((source, (x, y), area, special_flags))
+
+        if not self._track:
+            return None
+        return pygame.Rect(x, y, w, h).clip(self._clip)
+
+
+# teken volgorde in main.py: HUD tekst, entities, coin tekst (UI tekent daarna direct)
+HUD_LAYERS = ("hud",)
+ENTITY_LAYERS = ("player", "enemies", "projectiles", "pickups")
+MAIN_LAYERS = HUD_LAYERS + ENTITY_LAYERS + ("hud_top",)
+
+
+class RenderQueue:
+    """
+    Verzamelt (surface, positie) per layer tijdens de frame en tekent ze in
+    flush() met 1 Surface.blits() call per layer, in de volgorde van `layers`.
+
+        queue.layer("enemies").blit(img, rect)   # zelfde API als screen.blit
+        queue.flush()
+
+    track_rects=True: blit() geeft net als Surface.blit de (geclipte) rect
+    terug (scherm-coordinaten), voor dirty-rect rendering.
+
+    set_offset(layers, dx, dy): wereld-layers tekenen met de camera offset.
+    """
+
+    def __init__(self, screen: pygame.Surface, layers, track_rects: bool = False):
+        self.screen = screen
+        self.layers = tuple(layers)
+        self.track_rects = bool(track_rects)
+
+        clip = screen.get_rect()
+        self._items = {name: [] for name in self.layers}
+        self._targets = {name: _LayerTarget(self._items[name], clip, self.track_rects) for name in self.layers}
+        self.submitted = 0  # aantal blits in de laatste flush
+
+    def layer(self, name: str) -> _LayerTarget:
+        return self._targets[name]
+
+    def set_offset(self, layers, dx: int, dy: int = 0):
+        for name in layers:
+            target = self._targets[name]
+            target.dx = int(dx)
+            target.dy = int(dy)
+
+    def flush(self):
+        blits = self.screen.blits
+        n = 0
+        for name in self.layers:
+            items = self._items[name]
+            if items:
+                blits(items, doreturn=False)
+                n += len(items)
+                items.clear()
+        self.submitted = n
@@ -0,0 +1,119 @@
+# replay.py
+"""
+Input recording + deterministische replay.
+
+Per frame wordt opgeslagen: dt, een bitmask van de gameplay-keys,
+mouse buttons, mouse positie en de KEYDOWN / MOUSEBUTTONDOWN events
+(die gaan naar de UI handlers). Samen met de session seed in de header
+speelt een replay exact dezelfde run af.
+
+Bestandsformaat (little endian):
+    header: b"QBBR", u16 version, i64 seed
+    frame:  f64 dt, u32 keys, u8 mouse buttons, i16 mouse x, i16 mouse y, u8 n_events
+    event:  u8 kind, u32 code (key / button), i16 x, i16 y
+"""
+import struct
+
+import pygame
+
+from game_session import KeyState
+
+MAGIC = b"QBBR"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHq")
+_FRAME = struct.Struct("<dIBhhB")
+_EVENT = struct.Struct("<BIhh")
+
+# keys die de gameplay (Player.update / main) via get_pressed() leest
+TRACKED_KEYS = (
+    pygame.K_q,
+    pygame.K_d,
+    pygame.K_e,
+    pygame.K_RETURN,
+    pygame.K_SPACE,
+    pygame.K_LSHIFT,
+    pygame.K_RSHIFT,
+    pygame.K_r,
+    pygame.K_ESCAPE,
+)
+
+_EV_KEYDOWN = 1
+_EV_MOUSEDOWN = 2
+
+
+class InputRecorder:
+    def __init__(self, path: str, seed: int):
+        self.path = path
+        self._f = open(path, "wb")
+        self._f.write(_HEADER.pack(MAGIC, VERSION, int(seed)))
+        self.frames = 0
+
+    def write_frame(self, dt: float, keys, mouse_buttons, mouse_pos, events):
+        mask = 0
+        for bit, key in enumerate(TRACKED_KEYS):
+            if keys[key]:
+                mask |= 1 << bit
+
+        buttons = 0
+        for bit, down in enumerate(mouse_buttons[:3]):
+            if down:
+                buttons |= 1 << bit
+
+        packed = []
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                packed.append(_EVENT.pack(_EV_KEYDOWN, event.key, 0, 0))
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                x, y = event.pos
+                packed.append(_EVENT.pack(_EV_MOUSEDOWN, event.button, x, y))
+
+        mx, my = mouse_pos
+        self._f.write(_FRAME.pack(dt, mask, buttons, mx, my, len(packed)))
+        for chunk in packed:
+            self._f.write(chunk)
+        self.frames += 1
+
+    def close(self):
+        if not self._f.closed:
+            self._f.close()
+
+
+class InputReplay:
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._data = f.read()
+
+        magic, version, seed = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an input recording")
+        if version != VERSION:
+            raise ValueError(f"{path}: unsupported recording version {version}")
+
+        self.path = path
+        self.seed = seed
+        self._offset = _HEADER.size
+        self.frames = 0
+
+    def next_frame(self):
+        """(dt, keys, mouse_buttons, mouse_pos, events) of None als de opname op is."""
+        if self._offset + _FRAME.size > len(self._data):
+            return None
+
+        dt, mask, buttons, mx, my, n_events = _FRAME.unpack_from(self._data, self._offset)
+        self._offset += _FRAME.size
+
+        keys = KeyState(key for bit, key in enumerate(TRACKED_KEYS) if mask & (1 << bit))
+        mouse_buttons = tuple(bool(buttons & (1 << bit)) for bit in range(3))
+
+        events = []
+        for _ in range(n_events):
+            kind, code, x, y = _EVENT.unpack_from(self._data, self._offset)
+            self._offset += _EVENT.size
+            if kind == _EV_KEYDOWN:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=code))
+            elif kind == _EV_MOUSEDOWN:
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=code, pos=(x, y)))
+
+        self.frames += 1
+        return dt, keys, mouse_buttons, (mx, my), events
@@ -0,0 +1,58 @@
+# sampling.py
+import random
+
+
+class AliasTable:
+    """
+    Vose alias table: 1x compileren (O(n)), daarna elke draw O(1).
+    items/weights zoals bij random.choices(items, weights=weights).
+    """
+
+    def __init__(self, items, weights):
+        items = list(items)
+        weights = [float(w) for w in weights]
+
+        if not items or len(items) != len(weights):
+            raise ValueError("AliasTable needs matching, non-empty items and weights")
+        if any(w < 0 for w in weights):
+            raise ValueError(f"AliasTable weights must be >= 0: {weights!r}")
+
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError(f"AliasTable weights sum to zero: {weights!r}")
+
+        n = len(items)
+        self.items = items
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+
+        # restjes (float afronding) zijn altijd "vol"
+        for i in large + small:
+            self.prob[i] = 1.0
+            self.alias[i] = i
+
+    def __len__(self):
+        return len(self.items)
+
+    def sample(self, rng=random):
+        """1 draw met rng.random() (random module of een random.Random instance)."""
+        u = rng.random() * len(self.items)
+        i = int(u)
+        if (u - i) < self.prob[i]:
+            return self.items[i]
+        return self.items[self.alias[i]]
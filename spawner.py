@@ -1,6 +1,7 @@
 # spawner.py
 import random
 from entities.enemies.registry import get_enemy_class
+from sampling import AliasTable
 
 
 class EnemySpawner:
@@ -13,8 +14,13 @@ class EnemySpawner:
         interval_max: float = 2.5,
         max_enemies: int = 6,
         spawn_pad: int = 700,
+        rng=None,
     ):
+        # stream "spawner" (random_streams.py)
+        self.rng = rng if rng is not None else random
+
         self.pool = pool
+        self._table = self._compile_pool(pool)
         self.cfg = cfg_module
         self.spawn_y = spawn_y
 
@@ -32,7 +38,7 @@ class EnemySpawner:
 
     def _reset_timer(self):
         # safety: als min==max is uniform ook ok
-        self.timer = random.uniform(self.interval_min, self.interval_max)
+        self.timer = self.rng.uniform(self.interval_min, self.interval_max)
 
     def _normalize_spec(self, item):
         # dict-format
@@ -55,8 +61,16 @@ class EnemySpawner:
 
         raise TypeError(f"Invalid enemy spec in pool: {item!r}")
 
+    def _compile_pool(self, pool):
+        """pool -> AliasTable van (etype, cfg_key); None als de pool leeg is."""
+        if not pool:
+            return None
+        specs = [self._normalize_spec(x) for x in pool]
+        return AliasTable([(etype, cfg_key) for etype, cfg_key, _ in specs], [w for _, _, w in specs])
+
     def set_pool(self, pool):
         self.pool = pool
+        self._table = self._compile_pool(pool)
         self._reset_timer()  # ✅ meteen effect
 
     def set_interval(self, interval_min, interval_max):
@@ -68,14 +82,10 @@ class EnemySpawner:
         self.max_enemies = int(n)
 
     def _pick_enemy_spec(self):
-        if not self.pool:
+        if self._table is None:
             raise ValueError("EnemySpawner.pool is empty")
 
-        specs = [self._normalize_spec(x) for x in self.pool]
-        weights = [w for (_, _, w) in specs]
-
-        etype, cfg_key, _ = random.choices(specs, weights=weights, k=1)[0]
-        return etype, cfg_key
+        return self._table.sample(self.rng)
 
     def spawn_one(self, player_x: float, world_width: int):
         etype, cfg_key = self._pick_enemy_spec()
@@ -83,7 +93,7 @@ class EnemySpawner:
         EnemyClass = get_enemy_class(etype)
         cfg_dict = getattr(self.cfg, cfg_key)
 
-        side = random.choice([-1, 1])
+        side = self.rng.choice((-1, 1))
         x = player_x + side * self.spawn_pad
         x = max(80, min(world_width - 80, x))
 
@@ -0,0 +1,55 @@
+# text_cache.py
+"""
+Gecachte font rendering: tekst wordt alleen opnieuw gerasterized als de
+inhoud (of font/kleur) verandert. LRU: oude strings (bv. vorige coin
+tellingen) vallen er vanzelf uit.
+
+    from text_cache import render_text
+    surf = render_text(font, f"COINS: {coins}", (255, 255, 0))
+
+Gecachte surfaces zijn gedeeld: niet op tekenen. set_alpha() mag wel, zolang
+de caller dat elke frame zelf zet (zie de toast in main.py).
+"""
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = int(max_entries)
+        self._cache: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        key = (font, text, tuple(color), bool(antialias))
+        surf = self._cache.get(key)
+        if surf is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()  # display format: snellere blits
+
+        self._cache[key] = surf
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_default = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+    """font.render via de gedeelde TextCache."""
+    return _default.render(font, text, color, antialias)
@@ -0,0 +1,53 @@
+# timestep.py
+"""
+Vaste simulatie-stap los van de frame rate.
+
+De gameplay (GameSession.step) draait altijd met SIM_DT; per gerenderde frame
+worden zoveel stappen gedaan als de verstreken tijd toelaat. Een hitch geeft
+dus meer stappen i.p.v. 1 grote dt (geen tunneling / andere spronghoogte),
+en headless runs met SIM_DT zijn exact dezelfde simulatie als het spel.
+
+    for _ in range(timestep.advance(frame_dt)):
+        session.step(timestep.dt, inp)
+    session.render_alpha = timestep.alpha   # interpolatie tussen de laatste 2 stappen
+
+Catch-up is begrensd (max_steps per frame): wordt de simulatie zelf te traag,
+dan loopt het spel trager i.p.v. steeds verder achter te raken.
+"""
+
+SIM_HZ = 120
+SIM_DT = 1.0 / SIM_HZ
+
+
+class FixedTimestep:
+    def __init__(self, hz: int = SIM_HZ, max_steps: int = 8):
+        self.dt = 1.0 / float(hz)
+        self.max_steps = int(max_steps)
+        self.accumulator = 0.0
+        self.alpha = 1.0
+
+        # stats (profiler overlay / debugging)
+        self.steps = 0          # stappen in de laatste advance()
+        self.dropped = 0.0      # seconden weggegooid door de catch-up cap
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.alpha = 1.0
+
+    def advance(self, frame_dt: float) -> int:
+        """Voeg frame_dt toe; geeft het aantal simulatie-stappen voor deze frame."""
+        self.accumulator += max(0.0, float(frame_dt))
+
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            self.dropped += (steps - self.max_steps) * self.dt
+            self.accumulator -= (steps - self.max_steps) * self.dt
+            steps = self.max_steps
+
+        self.accumulator -= steps * self.dt
+        if self.accumulator < 0.0:  # float afronding
+            self.accumulator = 0.0
+
+        self.alpha = min(1.0, self.accumulator / self.dt)
+        self.steps = steps
+        return steps
@@ -0,0 +1,108 @@
+# tracing.py
+"""
+Chrome Trace Event export (openen in Perfetto / chrome://tracing).
+
+De frame thread zet alleen kleine (ph, name, t, tid, dur) tuples op een queue; een
+achtergrond thread formatteert en schrijft ze naar disk. Zo komt er geen
+disk I/O op de frame thread.
+
+    tracer = TraceWriter("out.json")
+    tracer.instrument(EnemyBase, "update")   # B/E events rond elke call
+    profiler.tracer = tracer                 # loop fases (laps) als B/E events, frames als X
+    ...
+    tracer.close()
+"""
+import functools
+import json
+import os
+import queue
+import threading
+import time
+
+
+class TraceWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self._q = queue.SimpleQueue()
+        self._t0 = time.perf_counter()
+        self._pid = os.getpid()
+        self._main_tid = threading.get_ident()
+        self.events = 0
+
+        self._thread = threading.Thread(target=self._run, name="trace-writer", daemon=True)
+        self._thread.start()
+
+    # -------------------------
+    # EVENTS (frame thread)
+    # -------------------------
+    def begin(self, name: str, t: float | None = None):
+        self._q.put(("B", name, time.perf_counter() if t is None else t, threading.get_ident(), 0.0))
+
+    def end(self, name: str, t: float | None = None):
+        self._q.put(("E", name, time.perf_counter() if t is None else t, threading.get_ident(), 0.0))
+
+    def span(self, name: str, start: float, end: float):
+        """Begin + end met bestaande perf_counter timestamps (bv. een profiler lap)."""
+        tid = threading.get_ident()
+        self._q.put(("B", name, start, tid, 0.0))
+        self._q.put(("E", name, end, tid, 0.0))
+
+    def complete(self, name: str, start: float, end: float):
+        """1 "X" event met duur; voor spans die pas achteraf bekend zijn maar hun laps omvatten."""
+        self._q.put(("X", name, start, threading.get_ident(), end - start))
+
+    def instrument(self, owner, attr: str, name: str | None = None):
+        """Wrap owner.attr (alleen als owner hem zelf definieert) met begin/end events."""
+        fn = owner.__dict__.get(attr)
+        if fn is None or getattr(fn, "_traced", False):
+            return
+
+        label = name or f"{owner.__name__}.{attr}"
+        put = self._q.put
+        clock = time.perf_counter
+        get_ident = threading.get_ident
+
+        @functools.wraps(fn)
+        def traced(*args, **kwargs):
+            tid = get_ident()
+            put(("B", label, clock(), tid, 0.0))
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                put(("E", label, clock(), tid, 0.0))
+
+        traced._traced = True
+        setattr(owner, attr, traced)
+
+    def close(self):
+        self._q.put(None)
+        self._thread.join()
+
+    # -------------------------
+    # WRITER (achtergrond thread)
+    # -------------------------
+    def _run(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+            f.write(json.dumps({
+                "name": "thread_name", "ph": "M", "pid": self._pid, "tid": self._main_tid,
+                "args": {"name": "frame"},
+            }))
+
+            names = {}  # name -> json string (1x escapen per naam)
+            while True:
+                item = self._q.get()
+                if item is None:
+                    break
+                ph, name, t, tid, dur = item
+
+                js = names.get(name)
+                if js is None:
+                    js = names[name] = json.dumps(name)
+
+                ts = (t - self._t0) * 1_000_000.0
+                extra = f', "dur": {dur * 1_000_000.0:.1f}' if ph == "X" else ""
+                f.write(f',\n{{"name": {js}, "ph": "{ph}", "ts": {ts:.1f}{extra}, "pid": {self._pid}, "tid": {tid}}}')
+                self.events += 1
+
+            f.write("\n]}\n")
@@ -1,5 +1,6 @@
 # ui/dialogue_ui.py
 import pygame
+from assets import load_image, load_scene, load_sound
 
 
 class DialogueUI:
@@ -41,8 +42,7 @@ class DialogueUI:
         # -------------------------
         # TYPING SOUND (loop while typing, stop when done)
         # -------------------------
-        self.dialogue_sfx = pygame.mixer.Sound("assets/Sounds/dialogue.mp3")
-        self.dialogue_sfx.set_volume(1.8)
+        self.dialogue_sfx = load_sound("assets/Sounds/dialogue.mp3", volume=1.8)
 
         # Dedicated channel so it never conflicts with other sounds
         self.typing_channel = pygame.mixer.Channel(7)
@@ -98,17 +98,14 @@ class DialogueUI:
     # -------------------------
     def _load_face(self, path: str) -> pygame.Surface:
         if path not in self.faces_cache:
-            img = pygame.image.load(path).convert_alpha()
+            img = load_image(path, alpha=True)
             img = pygame.transform.scale(img, (self.face_size, self.face_size))
             self.faces_cache[path] = img
         return self.faces_cache[path]
 
     def _load_scene(self, path: str) -> pygame.Surface:
         if path not in self.scene_cache:
-            sw, sh = self.screen.get_size()
-            img = pygame.image.load(path).convert()
-            img = pygame.transform.scale(img, (sw, sh))
-            self.scene_cache[path] = img
+            self.scene_cache[path] = load_scene(path, self.screen.get_size())
         return self.scene_cache[path]
 
     # -------------------------
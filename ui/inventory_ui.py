@@ -1,9 +1,12 @@
 # ui/inventory_ui.py
 import pygame
+from assets import load_image, load_sound
+from atlas import pack_ui
+from text_cache import render_text
 
 # ---------- HOVER SOUND ----------
-HOVER_SOUND = pygame.mixer.Sound("assets/Sounds/hover.wav")
-HOVER_SOUND.set_volume(0.5)
+# lazy via de gedeelde sound cache (startup loader heeft hem al gedecodeerd)
+HOVER_SOUND = "assets/Sounds/hover.wav"
 
 class InventoryUI:
     def __init__(
@@ -26,8 +29,8 @@ class InventoryUI:
         self._last_hover_index = None
 
         # ---------- LOAD ASSETS ----------
-        self.box = pygame.image.load("assets/Inventory/HotkeyBox.png").convert_alpha()
-        self.label = pygame.image.load("assets/Inventory/Hover_label.png").convert_alpha()
+        self.box = load_image("assets/Inventory/HotkeyBox.png", alpha=True)
+        self.label = load_image("assets/Inventory/Hover_label.png", alpha=True)
 
         self.box = pygame.transform.scale(
             self.box,
@@ -38,6 +41,9 @@ class InventoryUI:
             (int(self.label.get_width() * scale), int(self.label.get_height() * scale)),
         )
 
+        self.box = pack_ui(self.box)
+        self.label = pack_ui(self.label)
+
         self.box_w, self.box_h = self.box.get_size()
         self.label_w, self.label_h = self.label.get_size()
 
@@ -115,7 +121,7 @@ class InventoryUI:
 
         # 🔊 HOVER SOUND (alleen bij nieuw slot)
         if current_hover is not None and current_hover != self._last_hover_index:
-            HOVER_SOUND.play()
+            load_sound(HOVER_SOUND, volume=0.5).play()
 
         self._last_hover_index = current_hover
 
@@ -142,7 +148,7 @@ class InventoryUI:
         if not path:
             return None
 
-        img = pygame.image.load(path).convert_alpha()
+        img = load_image(path, alpha=True)
 
         # schaal naar box (subtiel kleiner)
         max_w = int(self.box_w * 0.65)
@@ -150,7 +156,7 @@ class InventoryUI:
         iw, ih = img.get_size()
         scale = min(max_w / iw, max_h / ih)
         new_size = (max(1, int(iw * scale)), max(1, int(ih * scale)))
-        img = pygame.transform.scale(img, new_size)
+        img = pack_ui(pygame.transform.scale(img, new_size))
 
         self._item_img_cache[item_id] = img
         return img
@@ -158,7 +164,7 @@ class InventoryUI:
     # -------------------------
     def draw(self, player, config):
         if not self.visible:
-            return
+            return None
 
         hotbar = self._get_hotbar_items(player, config)  # list[(id,count)]
         slot_items = [None] * self.slots
@@ -166,6 +172,7 @@ class InventoryUI:
             slot_items[i] = tup
 
         mx, my = pygame.mouse.get_pos()
+        drawn = []  # getekende rects (dirty-rect rendering)
 
         for i, r in enumerate(self.rects):
             # -------------------------
@@ -173,10 +180,10 @@ class InventoryUI:
             # -------------------------
             label_x = r.centerx - self.label_w // 2
             label_y = r.y - self.label_h + int(self.label_offset[i])
-            self.screen.blit(self.label, (label_x, label_y))
+            drawn.append(self.screen.blit(self.label, (label_x, label_y)))
 
             # box
-            self.screen.blit(self.box, r.topleft)
+            drawn.append(self.screen.blit(self.box, r.topleft))
 
             # item icon + count
             if slot_items[i] is not None:
@@ -186,25 +193,27 @@ class InventoryUI:
                 if icon:
                     ix = r.centerx - icon.get_width() // 2
                     iy = r.centery - icon.get_height() // 2
-                    self.screen.blit(icon, (ix, iy))
+                    drawn.append(self.screen.blit(icon, (ix, iy)))
 
                 # stack count rechtsonder (alleen tonen als > 1)
                 if count > 1:
                     text = str(count)
-                    cnt = self.font_count.render(text, True, (255, 255, 255))
-                    shadow = self.font_count.render(text, True, (0, 0, 0))
+                    cnt = render_text(self.font_count, text, (255, 255, 255))
+                    shadow = render_text(self.font_count, text, (0, 0, 0))
 
                     pad_x = int(4 * self.scale)   
                     pad_y = int(3.2 * self.scale)  
                     cx = r.right - cnt.get_width() - pad_x
                     cy = r.bottom - cnt.get_height() - pad_y
 
-                    self.screen.blit(shadow, (cx + 1, cy + 1))
-                    self.screen.blit(cnt, (cx, cy))
+                    drawn.append(self.screen.blit(shadow, (cx + 1, cy + 1)))
+                    drawn.append(self.screen.blit(cnt, (cx, cy)))
 
             # hover border (optioneel)
             if r.collidepoint((mx, my)):
-                pygame.draw.rect(self.screen, (255, 255, 255), r, 2, border_radius=8)
+                drawn.append(pygame.draw.rect(self.screen, (255, 255, 255), r, 2, border_radius=8))
+
+        return drawn[0].unionall(drawn[1:]) if drawn else None
 
     # -------------------------
     def get_item_in_slot(self, slot_index: int, player, config):
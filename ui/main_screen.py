@@ -1,5 +1,6 @@
 # ui/main_screen.py
 import pygame
+from assets import load_scene
 
 
 class MainScreen:
@@ -8,12 +9,8 @@ class MainScreen:
         self.w, self.h = screen.get_size()
 
         # -------- ASSETS --------
-        self.bg = pygame.image.load(
-            "assets/Mainscreen/Main_bg.png"
-        ).convert()
-
-        # scale naar scherm
-        self.bg = pygame.transform.scale(self.bg, (self.w, self.h))
+        # geschaald naar scherm
+        self.bg = load_scene("assets/Mainscreen/Main_bg.png", (self.w, self.h))
 
         # overlay voor contrast
         self.overlay = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
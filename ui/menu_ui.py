@@ -1,9 +1,11 @@
 # ui/menu_ui.py
 import pygame
+from assets import load_image, load_sound
+from atlas import pack_ui
 
 # ---------- HOVER SOUND ----------
-HOVER_SOUND = pygame.mixer.Sound("assets/Sounds/hover.wav")
-HOVER_SOUND.set_volume(0.5)
+# lazy via de gedeelde sound cache (startup loader heeft hem al gedecodeerd)
+HOVER_SOUND = "assets/Sounds/hover.wav"
 
 class MenuUI:
     def __init__(self, screen: pygame.Surface, scale: float = 1.6, margin: int = 24, spacing: int = 10):
@@ -19,7 +21,7 @@ class MenuUI:
         # -------------------------
         # load + scale assets
         # -------------------------
-        box_raw = pygame.image.load("assets/MenuUI/MenuBox.png").convert_alpha()
+        box_raw = load_image("assets/MenuUI/MenuBox.png", alpha=True)
         icon_paths = [
             "assets/MenuUI/Backpack.png",
             "assets/MenuUI/Profile.png",
@@ -40,7 +42,7 @@ class MenuUI:
         self.icons_hover = []
 
         for p in icon_paths:
-            img = pygame.image.load(p).convert_alpha()
+            img = load_image(p, alpha=True)
 
             normal = pygame.transform.scale(
                 img,
@@ -55,6 +57,12 @@ class MenuUI:
             )
             self.icons_hover.append(hover)
 
+        # boxes + icons in de UI atlas
+        self.box = pack_ui(self.box)
+        self.box_hover = pack_ui(self.box_hover)
+        self.icons = [pack_ui(img) for img in self.icons]
+        self.icons_hover = [pack_ui(img) for img in self.icons_hover]
+
         self.box_w = self.box.get_width()
         self.box_h = self.box.get_height()
 
@@ -86,7 +94,7 @@ class MenuUI:
 
         # 🔊 play sound only when hover ENTERS a new button
         if new_hover is not None and new_hover != self._last_hover:
-            HOVER_SOUND.play()
+            load_sound(HOVER_SOUND, volume=0.5).play()
 
         self.hover_index = new_hover
         self._last_hover = new_hover
@@ -101,19 +109,22 @@ class MenuUI:
 
     # -------------------------
     def draw(self):
+        drawn = None  # getekende regio (dirty-rect rendering)
         for i in range(3):
             r = self.rects[i]
 
             # box (hover highlight)
             box_img = self.box_hover if self.hover_index == i else self.box
-            self.screen.blit(box_img, r.topleft)
+            box_rect = self.screen.blit(box_img, r.topleft)
+            drawn = box_rect if drawn is None else drawn.union(box_rect)
 
             # icon (hover grootte)
             icon = self.icons_hover[i] if self.hover_index == i else self.icons[i]
 
             ix = r.x + (r.width - icon.get_width()) // 2
             iy = r.y + (r.height - icon.get_height()) // 2
-            self.screen.blit(icon, (ix, iy))
+            drawn.union_ip(self.screen.blit(icon, (ix, iy)))
 
             if self.hover_index == i:
-                pygame.draw.rect(self.screen, (255, 255, 255), r, 2, border_radius=8)
\ No newline at end of file
+                drawn.union_ip(pygame.draw.rect(self.screen, (255, 255, 255), r, 2, border_radius=8))
+        return drawn
\ No newline at end of file
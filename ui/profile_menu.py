@@ -1,5 +1,7 @@
 # ui/profile_menu.py
 import pygame
+from assets import load_image, load_sound
+from text_cache import render_text
 
 
 class ProfileMenu:
@@ -8,8 +10,7 @@ class ProfileMenu:
         self.visible = False
 
         # SFX
-        self.hover_sfx = pygame.mixer.Sound("assets/Sounds/hover.wav")
-        self.hover_sfx.set_volume(0.5)
+        self.hover_sfx = load_sound("assets/Sounds/hover.wav", volume=0.5)
         self._last_hover = None
 
         # fonts
@@ -25,8 +26,8 @@ class ProfileMenu:
         self.panel_rect = self.panel.get_rect(center=(sw // 2, sh // 2))
 
         # button assets (raw)
-        self.btn_raw = pygame.image.load("assets/Buttons/Button.png").convert_alpha()
-        self.hl_raw  = pygame.image.load("assets/Buttons/Highlight.png").convert_alpha()
+        self.btn_raw = load_image("assets/Buttons/Button.png", alpha=True)
+        self.hl_raw  = load_image("assets/Buttons/Highlight.png", alpha=True)
 
         # autosize padding
         self.pad_x = 30
@@ -68,7 +69,7 @@ class ProfileMenu:
         return self._hl_cache[key]
 
     def _autosize_single_line(self, text: str):
-        surf = self.text_font.render(text, True, (0, 0, 0))
+        surf = render_text(self.text_font, text, (0, 0, 0))
         w = surf.get_width() + self.pad_x * 2
         h = surf.get_height() + self.pad_y * 2
         h = min(h, self.max_btn_h)  # dun houden
@@ -171,7 +172,7 @@ class ProfileMenu:
         self.screen.blit(self.panel, self.panel_rect.topleft)
 
         # title
-        title = self.title_font.render("PROFILE", True, (255, 255, 255))
+        title = render_text(self.title_font, "PROFILE", (255, 255, 255))
         self.screen.blit(title, (self.panel_rect.x + 40, self.panel_rect.y + 30))
 
         # stats
@@ -195,7 +196,7 @@ class ProfileMenu:
             f"DAMAGE: {dmg}",
             f"COINS: {coins}",
         ]:
-            t = self.text_font.render(text, True, (230, 230, 230))
+            t = render_text(self.text_font, text, (230, 230, 230))
             self.screen.blit(t, (left_x, y))
             y += line_step
 
@@ -215,7 +216,7 @@ class ProfileMenu:
             self.screen.blit(btn, rect.topleft)
 
             # 1 lijn centreren
-            txt = self.text_font.render(text, True, (25, 25, 25))
+            txt = render_text(self.text_font, text, (25, 25, 25))
             tr = txt.get_rect(center=rect.center)
             self.screen.blit(txt, tr)
 
@@ -236,6 +237,6 @@ class ProfileMenu:
             self.screen.blit(close_hl, (self.close_rect.x - self.hl_pad_x, self.close_rect.y - self.hl_pad_y))
         self.screen.blit(close_btn, self.close_rect.topleft)
 
-        txt = self.text_font.render(close_text, True, (25, 25, 25))
+        txt = render_text(self.text_font, close_text, (25, 25, 25))
         tr = txt.get_rect(center=self.close_rect.center)
         self.screen.blit(txt, tr)
\ No newline at end of file
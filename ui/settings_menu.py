@@ -1,4 +1,6 @@
 import pygame
+from assets import load_image, load_sound
+from text_cache import render_text
 
 
 class SettingsMenu:
@@ -22,15 +24,14 @@ class SettingsMenu:
         # =========================
         # SFX
         # =========================
-        self.hover_sfx = pygame.mixer.Sound("assets/Sounds/hover.wav")
-        self.hover_sfx.set_volume(0.5)
+        self.hover_sfx = load_sound("assets/Sounds/hover.wav", volume=0.5)
         self._last_hover = None  # <--- belangrijk
 
         # =========================
         # LOAD RAW ASSETS
         # =========================
-        self.btn_raw = pygame.image.load("assets/Buttons/Button.png").convert_alpha()
-        self.hl_raw = pygame.image.load("assets/Buttons/Highlight.png").convert_alpha()
+        self.btn_raw = load_image("assets/Buttons/Button.png", alpha=True)
+        self.hl_raw = load_image("assets/Buttons/Highlight.png", alpha=True)
 
         self.font = pygame.font.SysFont(None, self.font_size)
 
@@ -138,6 +139,6 @@ class SettingsMenu:
             self.screen.blit(self.btn, r.topleft)
 
             # tekst
-            txt = self.font.render(it["label"], True, (25, 25, 25))
+            txt = render_text(self.font, it["label"], (25, 25, 25))
             tr = txt.get_rect(center=r.center)
             self.screen.blit(txt, tr)
\ No newline at end of file
@@ -1,6 +1,7 @@
 import pygame
 import math
 from assets import load_image
+from atlas import pack_ui
 
 
 class StatBarUI:
@@ -22,6 +23,10 @@ class StatBarUI:
         vb_h = self.valuebar.get_height()
         self.mana_valuebar = pygame.transform.scale(self.valuebar, (vb_w, int(vb_h * 0.5)))
 
+        # alle stukken in 1 UI atlas page (blits worden page + source rect)
+        for name in ("panel", "circle", "valuebar", "red", "blue", "knot", "heart", "mana_valuebar"):
+            setattr(self, name, pack_ui(getattr(self, name)))
+
         # values
         self.max_hp = 200
         self.hp = 200
@@ -101,7 +106,7 @@ class StatBarUI:
             return
         h = min(img.get_height(), int(height))
         part = img.subsurface(pygame.Rect(0, 0, w, h))
-        screen.blit(part, topleft)
+        return screen.blit(part, topleft)
 
     def _apply_mana_fx(self, base_img: pygame.Surface) -> pygame.Surface:
         """Return a surface for mana fill with pulse / grayscale depending on state."""
@@ -164,24 +169,29 @@ class StatBarUI:
         )
 
         # HP
-        self._blit_fill(screen, self.red, hp_fill_pos, hp_ratio, self.red_height)
-        screen.blit(self.valuebar, vb1_pos)
+        hp_fill = self._blit_fill(screen, self.red, hp_fill_pos, hp_ratio, self.red_height)
+        drawn = screen.blit(self.valuebar, vb1_pos)
 
         # MANA (with FX)
         blue_fx = self._apply_mana_fx(self.blue)
-        self._blit_fill(screen, blue_fx, mana_fill_pos, mana_ratio, self.blue_height)
-        screen.blit(self.mana_valuebar, vb2_pos)
+        mana_fill = self._blit_fill(screen, blue_fx, mana_fill_pos, mana_ratio, self.blue_height)
+        drawn.union_ip(screen.blit(self.mana_valuebar, vb2_pos))
+
+        for fill in (hp_fill, mana_fill):
+            if fill is not None:
+                drawn.union_ip(fill)
 
         # circle
         cpos = (
             x + int(self.circle_offset.x + self.circle_nudge.x),
             y + int(self.circle_offset.y + self.circle_nudge.y),
         )
-        screen.blit(self.circle, cpos)
+        drawn.union_ip(screen.blit(self.circle, cpos))
 
         # heart (center in circle)
         circle_rect = self.circle.get_rect(topleft=cpos)
         heart_rect = self.heart.get_rect(center=circle_rect.center)
         heart_rect.x += int(self.heart_nudge.x)
         heart_rect.y += int(self.heart_nudge.y)
-        screen.blit(self.heart, heart_rect)
\ No newline at end of file
+        drawn.union_ip(screen.blit(self.heart, heart_rect))
+        return drawn  # getekende regio (dirty-rect rendering)
\ No newline at end of file